@@ -29,36 +29,148 @@ Notes:
 - Input vanilla root should contain "data/..." as extracted from CASC.
 - This tool never reads or writes .bin files.
 """
-import argparse, csv, hashlib, json, re, shutil
+import argparse, csv, io, json, re, shutil, sys
 import csv
-import io
+import operator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 import time
 SCRIPT_DIR = Path(__file__).resolve().parent
 
+_MOD_MIN_RE = re.compile(r"^mod(\d+)min$", re.I)
+_MIN_COL_RE = re.compile(r"min\d+")
+_MINN_RE = re.compile(r"min(\d+)\Z", re.I)
+_INT_RE = re.compile(r"-?\d+")
+_TRAILING_NUM_RE = re.compile(r"(\d+)$")
+# Userspace buffer for table writes: multi-MB TSVs go out in a few large write() calls.
+IO_BUFSIZE = 1 << 20
+
 def read_tsv(path: Path):
-    text = path.read_text(encoding="utf-8-sig")
-    newline = "\r\n" if ("\r\n" in text and text.count("\r\n") >= text.count("\n")/2) else "\n"
-    lines = text.splitlines()
-    rows = list(csv.reader(lines, delimiter="\t"))
-    if not rows:
+    # Newline style is decided over the whole decoded file (mixed endings keep the majority
+    # style). Most tables hold no quote characters and no bare CR, and for those csv.reader's
+    # tokenizing is exactly str.split("\t") per line, so they take a plain split path; anything
+    # else (quoted cells in cubemain, properties, treasureclassex, ...) goes through csv.reader.
+    text = path.read_bytes().decode("utf-8-sig")
+    crlf = text.count("\r\n")
+    newline = "\r\n" if (crlf and crlf >= text.count("\n")/2) else "\n"
+    if '"' in text or text.count("\r") != text.count("\r\n"):
+        rdr = csv.reader(io.StringIO(text, newline=""), delimiter="\t")
+    else:
+        lines = text.split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        rdr = (ln[:-1].split("\t") if ln.endswith("\r") else ln.split("\t") for ln in lines)
+    header = next(rdr, None)
+    if header is None:
         raise ValueError(f"Empty TSV: {path}")
-    header = rows[0]
+    header = [sys.intern(c) for c in header]
     data = []
-    for r in rows[1:]:
+    for r in rdr:
         if not r or not any(cell != "" for cell in r):
             continue
         r = r + [""] * (len(header) - len(r))
         data.append(dict(zip(header, r[:len(header)])))
     return header, data, newline
 
+def _break_hardlink(path: Path) -> None:
+    # Tables seeded with --link-vanilla-excel share an inode with the vanilla dump; drop the
+    # link before rewriting so the write lands in a new file instead of truncating vanilla.
+    try:
+        if path.stat().st_nlink > 1:
+            path.unlink()
+    except FileNotFoundError:
+        pass
+
 def write_tsv(path: Path, header, data, newline="\n"):
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="") as f:
+    _break_hardlink(path)
+    with path.open("w", encoding="utf-8", newline="", buffering=IO_BUFSIZE) as f:
         w = csv.writer(f, delimiter="\t", lineterminator=newline, quoting=csv.QUOTE_MINIMAL)
         w.writerow(header)
-        for r in data:
-            w.writerow([r.get(h, "") for h in header])
+        # Positional pull of all cells per row in one C call; rows missing a header key
+        # (not produced by read_tsv) fall back to the per-cell .get path.
+        getter = operator.itemgetter(*header) if len(header) > 1 else (lambda r: (r[header[0]],))
+
+        def cells(r):
+            try:
+                return getter(r)
+            except KeyError:
+                return [r.get(h, "") for h in header]
+
+        w.writerows(map(cells, data))
+
+@lru_cache(maxsize=None)
+def _read_vanilla_tsv_cached(path_str: str):
+    # Backing cache for read_vanilla_tsv only; go through that accessor.
+    return read_tsv(Path(path_str))
+
+def read_vanilla_tsv(rel: str):
+    """read_tsv for a table under _VANILLA_ROOT, parsed at most once per run.
+
+    Vanilla is never written during a run, so every caller gets the same shared parse:
+    treat the returned header and rows as read-only (copy rows before mutating them).
+    """
+    if _VANILLA_ROOT is None:
+        raise RuntimeError("PATCHER ASSERTION FAILED: _VANILLA_ROOT not set; cannot read vanilla tables.")
+    return _read_vanilla_tsv_cached(str(_VANILLA_ROOT / rel))
+
+def read_dict_tsv(path: Path):
+    """Load a tab/';' separated table with csv.DictReader.
+
+    The delimiter is sniffed from a bytes probe of the header line and the reader streams the
+    file (no whole-file splitlines). Returns (delimiter, fieldnames, rows), or None if the file is empty.
+    """
+    with path.open("rb") as f:
+        head = f.read(8192)
+    if not head:
+        return None
+    first = head.split(b"\n", 1)[0].decode("utf-8", errors="ignore")
+    delim = "\t" if "\t" in first else (";" if ";" in first else "\t")
+    with path.open("r", encoding="utf-8", errors="ignore", newline="") as f:
+        rdr = csv.DictReader(f, delimiter=delim)
+        return delim, rdr.fieldnames, list(rdr)
+
+def _join_dict_rows(fieldnames, rows, delimiter: str):
+    """Plain-join rendering of DictReader-style rows, or None if any cell needs csv quoting.
+
+    Cells with a quote, CR/LF or the delimiter (and None/extra keys, which DictWriter treats
+    specially) make this return None so the caller falls back to csv.DictWriter.
+    """
+    n = len(fieldnames)
+    if n < 2:
+        return None
+    get = operator.itemgetter(*fieldnames)
+    lines = [delimiter.join(fieldnames)]
+    try:
+        for r in rows:
+            if len(r) != n:
+                return None
+            lines.append(delimiter.join(get(r)))
+    except (KeyError, TypeError):
+        return None
+    text = "\n".join(lines)
+    if '"' in text or "\r" in text or text.count("\n") != len(lines) - 1 \
+            or text.count(delimiter) != len(lines) * (n - 1):
+        return None
+    return text + "\n"
+
+def write_dict_tsv(path: Path, fieldnames, rows, delimiter="\t"):
+    """Write DictReader-style rows to path.
+
+    Tables with nothing to quote are written as one joined string; otherwise rows stream
+    through csv.DictWriter (no intermediate StringIO/str copy).
+    """
+    _break_hardlink(path)
+    text = _join_dict_rows(fieldnames, rows, delimiter)
+    if text is not None:
+        with path.open("w", encoding="utf-8") as f:
+            f.write(text)
+        return
+    with path.open("w", encoding="utf-8", buffering=IO_BUFSIZE) as f:
+        w = csv.DictWriter(f, fieldnames=fieldnames, delimiter=delimiter, lineterminator="\n")
+        w.writeheader()
+        w.writerows(rows)
 
 
 def patch_monstats_cow_xp_boost(mod_root, report, mult=9999):
@@ -70,7 +182,7 @@ def patch_monstats_cow_xp_boost(mod_root, report, mult=9999):
     from pathlib import Path
 
     p = mod_root / "data/global/excel/monstats.txt"
-    if not p.exists():
+    if not excel_table_exists(p):
         report.append(f"[cow-xp] monstats.txt not found at: {p} (skipped)")
         return
 
@@ -85,29 +197,33 @@ def patch_monstats_cow_xp_boost(mod_root, report, mult=9999):
         return
 
     targets = {"hellbovine", "cowking"}
+    cow_rows = [r for r in rows if (r.get("Id") or r.get("id") or "").strip().lower() in targets]
+    changed_rows, changed_cells = _scale_int_columns(cow_rows, exp_cols, int(mult))
+
+    if changed_cells:
+        write_tsv(p, h, rows, nl)
+    report.append(f"[cow-xp] Increased cow monster XP in monstats.txt by x{mult} (rows: {changed_rows}, cells: {changed_cells})")
+
+def _scale_int_columns(rows: list[dict[str, str]], cols: list[str], mult: int) -> tuple[int, int]:
+    """Multiply integer cells in `cols` by `mult` in place; non-numeric cells are left alone.
+
+    Returns (rows changed, cells changed).
+    """
     changed_rows = 0
     changed_cells = 0
-
     for r in rows:
-        mid = (r.get("Id") or r.get("id") or "").strip().lower()
-        if mid not in targets:
-            continue
         row_changed = False
-        for c in exp_cols:
+        for c in cols:
             v = (r.get(c) or "").strip()
-            if not v or not re.fullmatch(r"-?\d+", v):
+            if not v or not _INT_RE.fullmatch(v):
                 continue
-            iv = int(v)
-            nv = iv * int(mult)
-            if str(nv) != v:
-                r[c] = str(nv)
+            nv = str(int(v) * mult)
+            if nv != v:
+                r[c] = nv
                 changed_cells += 1
                 row_changed = True
-        if row_changed:
-            changed_rows += 1
-
-    write_tsv(p, h, rows, nl)
-    report.append(f"[cow-xp] Increased cow monster XP in monstats.txt by x{mult} (rows: {changed_rows}, cells: {changed_cells})")
+        changed_rows += row_changed
+    return changed_rows, changed_cells
 
 def patch_charstats_from_reference(mod_root: Path, patch_sources: Path, log_lines: list[str]) -> None:
     """
@@ -121,50 +237,39 @@ def patch_charstats_from_reference(mod_root: Path, patch_sources: Path, log_line
     dst_path = mod_root / rel
     ref_path = patch_sources / "charstats.reference.txt"
 
-    if not dst_path.exists():
+    if not excel_table_exists(dst_path):
         log_lines.append(f"[charstats] missing {rel} in output (skipped)")
         return
     if not ref_path.exists():
         log_lines.append("[charstats] missing patch_sources/charstats.reference.txt (skipped)")
         return
 
-    dst_lines = dst_path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    ref_lines = ref_path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    if not dst_lines or not ref_lines:
+    dst_tbl = read_dict_tsv(dst_path)
+    ref_tbl = read_dict_tsv(ref_path)
+    if dst_tbl is None or ref_tbl is None:
         log_lines.append("[charstats] empty dst/ref (skipped)")
         return
 
-    # delimiter detection
-    dst_delim = "\t" if "\t" in dst_lines[0] else (";" if ";" in dst_lines[0] else "\t")
-    ref_delim = "\t" if "\t" in ref_lines[0] else (";" if ";" in ref_lines[0] else "\t")
+    dst_delim, dst_fields, dst_in = dst_tbl
+    ref_delim, ref_fields, ref_in = ref_tbl
 
-    dst_reader = csv.DictReader(dst_lines, delimiter=dst_delim)
-    ref_reader = csv.DictReader(ref_lines, delimiter=ref_delim)
-
-    if not dst_reader.fieldnames or not ref_reader.fieldnames:
+    if not dst_fields or not ref_fields:
         log_lines.append("[charstats] missing headers (skipped)")
         return
 
-    if "class" not in [c.lower() for c in dst_reader.fieldnames]:
+    # Find exact class column name in each file (cached lowercase header map, no per-call lists)
+    dst_class_col = find_col(dst_fields, "class")
+    ref_class_col = find_col(ref_fields, "class")
+    if dst_class_col is None:
         log_lines.append("[charstats] dst missing 'class' column (skipped)")
         return
-    if "class" not in [c.lower() for c in ref_reader.fieldnames]:
+    if ref_class_col is None:
         log_lines.append("[charstats] ref missing 'class' column (skipped)")
         return
 
-    # Find exact class column name in each file
-    def find_col(fieldnames, target_lower):
-        for c in fieldnames:
-            if c.lower() == target_lower:
-                return c
-        return None
-
-    dst_class_col = find_col(dst_reader.fieldnames, "class")
-    ref_class_col = find_col(ref_reader.fieldnames, "class")
-
     # Build reference map: class -> row dict
     ref_map = {}
-    for r in ref_reader:
+    for r in ref_in:
         if not r:
             continue
         key = (r.get(ref_class_col) or "").strip().lower()
@@ -172,39 +277,39 @@ def patch_charstats_from_reference(mod_root: Path, patch_sources: Path, log_line
             continue
         ref_map[key] = r
 
-    # Apply overrides for matching columns (only columns that exist in dst)
+    # Apply overrides for matching columns (only columns that exist in dst and ref), resolved once
+    ref_cols = header_meta(ref_fields)["set"]
+    override_cols = [c for c in dst_fields if c != dst_class_col and c in ref_cols]
+    # Per class, the (column, value) overrides: only columns where the reference provides a
+    # non-empty value. Resolved once per reference row instead of once per matching dst row.
+    ref_overrides = {}
+    for key, ref_row in ref_map.items():
+        pairs = [(col, ref_row.get(col)) for col in override_cols]
+        ref_overrides[key] = [(col, v) for col, v in pairs if v is not None and str(v).strip() != ""]
     dst_rows = []
     changed_cells = 0
     changed_rows = 0
 
-    for r in dst_reader:
+    for r in dst_in:
         if not r:
             continue
         key = (r.get(dst_class_col) or "").strip().lower()
-        ref_row = ref_map.get(key)
+        overrides = ref_overrides.get(key)
         row_changed = False
 
-        if ref_row is not None:
-            for col in dst_reader.fieldnames:
-                if col == dst_class_col:
-                    continue
-                # only override if the reference provides a non-empty value for that column
-                if col in ref_row:
-                    v = ref_row.get(col)
-                    if v is not None and str(v).strip() != "" and r.get(col) != v:
-                        r[col] = v
-                        changed_cells += 1
-                        row_changed = True
+        if overrides is not None:
+            for col, v in overrides:
+                if r.get(col) != v:
+                    r[col] = v
+                    changed_cells += 1
+                    row_changed = True
 
         if row_changed:
             changed_rows += 1
         dst_rows.append(r)
 
-    out = io.StringIO()
-    w = csv.DictWriter(out, fieldnames=dst_reader.fieldnames, delimiter=dst_delim, lineterminator="\n")
-    w.writeheader()
-    w.writerows(dst_rows)
-    dst_path.write_text(out.getvalue(), encoding="utf-8")
+    if changed_cells:
+        write_dict_tsv(dst_path, dst_fields, dst_rows, dst_delim)
 
     log_lines.append(f"[charstats] applied reference overrides from {ref_path.name}: {changed_rows} row(s), {changed_cells} cell(s) updated")
 
@@ -219,37 +324,29 @@ def patch_treasureclassex_andariel(mod_root: Path, report: list[str]) -> None:
     """
     rel = Path("data/global/excel/treasureclassex.txt")
     path = mod_root / rel
-    if not path.exists():
+    if not excel_table_exists(path):
         report.append(f"[treasureclassex] missing {rel} in output (skipped)")
         return
 
-    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    if not lines:
+    tbl = read_dict_tsv(path)
+    if tbl is None:
         report.append("[treasureclassex] empty file (skipped)")
         return
 
-    delim = "\t" if "\t" in lines[0] else (";" if ";" in lines[0] else "\t")
-    rdr = csv.DictReader(lines, delimiter=delim)
-    if not rdr.fieldnames:
+    delim, fields, rows_in = tbl
+    if not fields:
         report.append("[treasureclassex] missing header (skipped)")
         return
 
     # Determine the treasure class name column (usually "Treasure Class")
-    def find_col(fieldnames, want_lower):
-        for c in fieldnames:
-            if c.lower() == want_lower:
-                return c
-        return None
-
-    tc_col = find_col(rdr.fieldnames, "treasure class")
+    tc_col = find_col(fields, "treasure class")
     if tc_col is None:
         # fall back to first column name
-        tc_col = rdr.fieldnames[0]
+        tc_col = fields[0]
 
-    rows = []
+    rows = rows_in
     by_name = {}
-    for row in rdr:
-        rows.append(row)
+    for row in rows:
         key = (row.get(tc_col) or "").strip()
         if key:
             by_name[key] = row
@@ -263,6 +360,7 @@ def patch_treasureclassex_andariel(mod_root: Path, report: list[str]) -> None:
     changed_cells = 0
     changed_rows = 0
     missing = []
+    copy_cols = [col for col in fields if col != tc_col]
 
     for dst_name, src_name in pairs:
         dst = by_name.get(dst_name)
@@ -272,9 +370,7 @@ def patch_treasureclassex_andariel(mod_root: Path, report: list[str]) -> None:
             continue
 
         row_changed = False
-        for col in rdr.fieldnames:
-            if col == tc_col:
-                continue
+        for col in copy_cols:
             if dst.get(col) != src.get(col):
                 dst[col] = src.get(col)
                 changed_cells += 1
@@ -282,11 +378,8 @@ def patch_treasureclassex_andariel(mod_root: Path, report: list[str]) -> None:
         if row_changed:
             changed_rows += 1
 
-    out = io.StringIO()
-    w = csv.DictWriter(out, fieldnames=rdr.fieldnames, delimiter=delim, lineterminator="\n")
-    w.writeheader()
-    w.writerows(rows)
-    path.write_text(out.getvalue(), encoding="utf-8")
+    if changed_cells:
+        write_dict_tsv(path, fields, rows, delim)
 
     if missing:
         report.append("[treasureclassex] Andariel quest-drop patch partial: missing pair(s): " +
@@ -305,40 +398,37 @@ def patch_skills_intown_from_reference(mod_root: Path, patch_sources: Path, repo
     dst_path = mod_root / rel
     ref_path = patch_sources / "skills.reference.txt"
 
-    if not dst_path.exists():
+    if not excel_table_exists(dst_path):
         report.append(f"[skills] missing {rel} in output (skipped)")
         return
     if not ref_path.exists():
         report.append("[skills] missing patch_sources/skills.reference.txt (skipped)")
         return
 
-    dst_lines = dst_path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    ref_lines = ref_path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    if not dst_lines or not ref_lines:
+    dst_tbl = read_dict_tsv(dst_path)
+    ref_tbl = read_dict_tsv(ref_path)
+    if dst_tbl is None or ref_tbl is None:
         report.append("[skills] empty dst/ref (skipped)")
         return
 
-    dst_delim = "\t" if "\t" in dst_lines[0] else (";" if ";" in dst_lines[0] else "\t")
-    ref_delim = "\t" if "\t" in ref_lines[0] else (";" if ";" in ref_lines[0] else "\t")
-
-    dst_reader = csv.DictReader(dst_lines, delimiter=dst_delim)
-    ref_reader = csv.DictReader(ref_lines, delimiter=ref_delim)
+    dst_delim, dst_fields, dst_in = dst_tbl
+    ref_delim, ref_fields, ref_in = ref_tbl
 
-    if not dst_reader.fieldnames or not ref_reader.fieldnames:
+    if not dst_fields or not ref_fields:
         report.append("[skills] missing headers (skipped)")
         return
 
     # skill name column is typically 'skill' (first column); use first header as fallback.
-    skill_col_dst = dst_reader.fieldnames[0]
-    skill_col_ref = ref_reader.fieldnames[0]
+    skill_col_dst = dst_fields[0]
+    skill_col_ref = ref_fields[0]
 
-    if "InTown" not in dst_reader.fieldnames or "InTown" not in ref_reader.fieldnames:
+    if "InTown" not in dst_fields or "InTown" not in ref_fields:
         report.append("[skills] missing InTown column in dst/ref (skipped)")
         return
 
     # Map: skill -> InTown value (non-empty) from reference
     ref_map = {}
-    for r in ref_reader:
+    for r in ref_in:
         if not r:
             continue
         k = (r.get(skill_col_ref) or "").strip()
@@ -355,7 +445,7 @@ def patch_skills_intown_from_reference(mod_root: Path, patch_sources: Path, repo
     rows = []
     changed_rows = 0
     changed_cells = 0
-    for r in dst_reader:
+    for r in dst_in:
         if not r:
             continue
         k = (r.get(skill_col_dst) or "").strip()
@@ -367,113 +457,127 @@ def patch_skills_intown_from_reference(mod_root: Path, patch_sources: Path, repo
                 changed_cells += 1
         rows.append(r)
 
-    out = io.StringIO()
-    w = csv.DictWriter(out, fieldnames=dst_reader.fieldnames, delimiter=dst_delim, lineterminator="\n")
-    w.writeheader()
-    w.writerows(rows)
-    dst_path.write_text(out.getvalue(), encoding="utf-8")
+    if changed_cells:
+        write_dict_tsv(dst_path, dst_fields, rows, dst_delim)
 
     report.append(f"[skills] InTown overrides applied from skills.reference.txt: {changed_rows} row(s) updated")
 
 
-def patch_uniqueitems_force_max_rolls(mod_root: Path, report: list[str]) -> None:
-    """Force maximum rolls for all ranged stats on uniqueitems.txt (generic; no named special cases)."""
-    excel = mod_root / "data" / "global" / "excel"
-    p_uni = excel / "uniqueitems.txt"
-    if not p_uni.exists():
-        report.append("[unique-maxrolls] uniqueitems.txt not found; skipped")
-        return
-
-    hh, rows, _ = read_tsv(p_uni)
-
-    def nk(k: str) -> str:
-        return (k or "").strip().lower()
-
-    ver_k = next((k for k in hh if nk(k) == "version"), None)
-    min_cols = [c for c in hh if nk(c).startswith("min") and nk(c)[3:].isdigit()]
-
-    if not min_cols:
-        report.append("[unique-maxrolls] no min/max columns found; skipped")
-        return
+def _copy_max_into_min(rows: list[dict[str, str]], pairs) -> tuple[int, int]:
+    """
+    Shared min:=max kernel for the maxroll patchers.
 
+    For every (min_col, max_col) pair, copy the stripped max cell into the min cell when the max
+    is non-empty and differs. Runs one tight loop per pair; raw-equal cells skip the strip work.
+    Callers pass read_tsv rows (every header key present, as a str) already filtered by their
+    own version gate, and pairs of header columns, so cells are indexed directly.
+    Returns (changed_rows, changed_cells).
+    """
+    changed_row_ids = set()
     changed_cells = 0
-    changed_rows = 0
-
-    for r in rows:
-        if ver_k:
-            vv = (r.get(ver_k) or "").strip()
-            if vv.lower() == "expansion":
-                continue
 
-        row_changed = False
-        for c in min_cols:
-            mx = "max" + c[3:]
-            if mx not in hh:
+    for mn, mx in pairs:
+        for r in rows:
+            mxv = r[mx]
+            mnv = r[mn]
+            if mnv == mxv:
                 continue
-            mxv = (r.get(mx) or "").strip()
-            if not mxv:
+            mxv = mxv.strip()
+            if mxv == "":
                 continue
-            if (r.get(c) or "").strip() != mxv:
-                r[c] = mxv
+            if mnv.strip() != mxv:
+                r[mn] = mxv
                 changed_cells += 1
-                row_changed = True
+                changed_row_ids.add(id(r))
 
-        if row_changed:
-            changed_rows += 1
+    return (len(changed_row_ids), changed_cells)
 
-    if changed_cells:
-        write_tsv(p_uni, hh, rows)
+
+def _uniqueitems_force_max_rows(hh: list[str], rows: list[dict[str, str]], report: list[str]) -> int:
+    """Force maximum rolls for all ranged stats on uniqueitems rows in place (generic; no named
+    special cases; Expansion rows untouched). Returns changed cells."""
+    ver_k = find_first_column(hh, "version")
+    min_cols = [c for c in hh if _MINN_RE.match(normalize_column_key(c))]
+
+    if not min_cols:
+        report.append("[unique-maxrolls] no min/max columns found; skipped")
+        return 0
+
+    # (min column, max column) pairs are resolved once per table, not per row.
+    hset = header_meta(hh)["set"]
+    pairs = [(c, "max" + c[3:]) for c in min_cols if "max" + c[3:] in hset]
+
+    if ver_k:
+        rows_in_scope = [r for r in rows if (r.get(ver_k) or "").strip().lower() != "expansion"]
+    else:
+        rows_in_scope = rows
+    changed_rows, changed_cells = _copy_max_into_min(rows_in_scope, pairs)
 
     report.append(f"[unique-maxrolls] forced max rolls (rows changed: {changed_rows}, cells: {changed_cells})")
+    return changed_cells
 
-def patch_setitems_force_max_rolls(mod_root: Path, report: list[str]) -> None:
-    """Force maximum rolls for all ranged stats on setitems.txt (generic; no named special cases)."""
-    rel = Path("data/global/excel/setitems.txt")
-    p = mod_root / rel
-    if not p.exists():
-        report.append(f"[set-max] missing {rel} (skipped)")
+def patch_uniqueitems_classic_rolls(mod_root: Path, report: list[str]) -> None:
+    """Classic uniqueitems.txt rolls: forced max rolls, then lvlreq=0, on one parse/write."""
+    p = mod_root / "data/global/excel/uniqueitems.txt"
+    if not excel_table_exists(p):
+        report.append("[unique-maxrolls] uniqueitems.txt not found; skipped")
+        report.append("[uniq-lvlreq] uniqueitems.txt not found; skipping")
         return
 
-    hh, rows, _ = read_tsv(p)
-
-    def nk(k: str) -> str:
-        return (k or "").strip().lower()
+    h, rows, _ = read_tsv(p)
+    changed = _uniqueitems_force_max_rows(h, rows, report)
+    changed += _unique_lvlreq_rows(h, rows, report)
+    if changed:
+        write_tsv(p, h, rows)
 
-    ver_k = next((k for k in hh if nk(k) == "version"), None)
-    min_cols = [c for c in hh if nk(c).startswith("min") and nk(c)[3:].isdigit()]
+def _setitems_force_max_rows(hh: list[str], rows: list[dict[str, str]], report: list[str]) -> int:
+    """Force maximum rolls for all ranged stats on non-Expansion setitems rows in place; returns changed cells."""
+    ver_k = find_first_column(hh, "version")
+    min_cols = [c for c in hh if _MINN_RE.match(normalize_column_key(c))]
     if not min_cols:
         report.append("[set-max] no min/max columns found (skipped)")
-        return
+        return 0
 
-    changed_cells = 0
-    changed_rows = 0
+    # (min column, max column) pairs are resolved once per table, not per row.
+    hset = header_meta(hh)["set"]
+    pairs = [(c, "max" + c[3:]) for c in min_cols if "max" + c[3:] in hset]
 
-    for r in rows:
-        if ver_k:
-            vv = (r.get(ver_k) or "").strip()
-            if vv.lower() == "expansion":
-                continue
+    if ver_k:
+        rows_in_scope = [r for r in rows if (r.get(ver_k) or "").strip().lower() != "expansion"]
+    else:
+        rows_in_scope = rows
+    changed_rows, changed_cells = _copy_max_into_min(rows_in_scope, pairs)
+    report.append(f"[set-max] forced max rolls (rows changed: {changed_rows}, cells: {changed_cells})")
+    return changed_cells
 
-        row_changed = False
-        for c in min_cols:
-            mx = "max" + c[3:]
-            if mx not in hh:
-                continue
-            mxv = (r.get(mx) or "").strip()
-            if not mxv:
-                continue
-            if (r.get(c) or "").strip() != mxv:
-                r[c] = mxv
-                changed_cells += 1
-                row_changed = True
+@lru_cache(maxsize=None)
+def _detect_min_max_pairs(headers: tuple[str, ...]) -> tuple[bool, tuple[tuple[str, str], ...]]:
+    """Return (has_version, ((min_col, max_col), ...)) for a header; cached per header tuple."""
+    has_version = any(h.lower() == "version" for h in headers)
+    lower_to_header = {}
+    for h in headers:
+        lower_to_header.setdefault(h.lower(), h)
 
-        if row_changed:
-            changed_rows += 1
+    pairs: list[tuple[str, str]] = []
 
-    if changed_cells:
-        write_tsv(p, hh, rows)
+    # Schema (1): minN/maxN
+    for c in headers:
+        if _MINN_RE.match(c):
+            mx_key = lower_to_header.get(("max" + c[3:]).lower())
+            if mx_key:
+                pairs.append((c, mx_key))
+
+    # Schema (2): modNmin/modNmax
+    for c in headers:
+        m = _MOD_MIN_RE.match(c)
+        if not m:
+            continue
+        mx_key = lower_to_header.get(f"mod{m.group(1)}max")
+        if mx_key:
+            pairs.append((c, mx_key))
+
+    return (has_version, tuple(pairs))
 
-    report.append(f"[set-max] forced max rolls (rows changed: {changed_rows}, cells: {changed_cells})")
 
 def _force_min_equals_max(rows: list[dict[str, str]], headers: list[str], version_value: str) -> tuple[int, int]:
     """
@@ -488,68 +592,34 @@ def _force_min_equals_max(rows: list[dict[str, str]], headers: list[str], versio
       - If the table has no 'version' column (common), all rows are treated as eligible (Classic-only mod safety).
     Returns (changed_rows, changed_cells).
     """
-    # Detect whether version gating is available
-    has_version = any(h.lower() == "version" for h in headers)
-
-    pairs: list[tuple[str, str]] = []
-
-    # Schema (1): minN/maxN
-    min_cols = [c for c in headers if c.lower().startswith("min") and c[3:].isdigit()]
-    for c in min_cols:
-        n = c[3:]
-        mx = "max" + n
-        mx_key = next((h for h in headers if h.lower() == mx.lower()), None)
-        if mx_key:
-            pairs.append((c, mx_key))
-
-    # Schema (2): modNmin/modNmax
-    for c in headers:
-        m = re.match(r"^mod(\d+)min$", c, flags=re.I)
-        if not m:
-            continue
-        n = m.group(1)
-        mx = f"mod{n}max"
-        mx_key = next((h for h in headers if h.lower() == mx.lower()), None)
-        if mx_key:
-            pairs.append((c, mx_key))
+    has_version, pairs = _detect_min_max_pairs(tuple(headers))
 
     if not pairs:
         return (0, 0)
 
-    changed_rows = 0
-    changed_cells = 0
-
-    for r in rows:
-        if has_version:
-            if (r.get("version") or "").strip() != version_value:
-                continue
-
-        row_changed = False
-        for mn, mx in pairs:
-            mxv = (r.get(mx) or "").strip()
-            if mxv == "":
-                continue
-            if (r.get(mn) or "").strip() != mxv:
-                r[mn] = mxv
-                changed_cells += 1
-                row_changed = True
-
-        if row_changed:
-            changed_rows += 1
+    # Version gate is evaluated once per row up front; the copy then runs column-pair
+    # at a time over the eligible rows (see _copy_max_into_min).
+    if has_version:
+        eligible = rows_with_version(rows, "version", (version_value,))
+        if not eligible:
+            return (0, 0)
+    else:
+        eligible = rows
 
-    return (changed_rows, changed_cells)
+    return _copy_max_into_min(eligible, pairs)
 
 
 def patch_magicprefix_force_max_rolls(mod_root: Path, report: list[str]) -> None:
     """Force max rolls for all magic prefixes (Classic rows: version=0)."""
     rel = Path("data/global/excel/magicprefix.txt")
     p = mod_root / rel
-    if not p.exists():
+    if not excel_table_exists(p):
         report.append(f"[affix-max] missing {rel} (skipped)")
         return
     h, rows, nl = read_tsv(p)
     cr, cc = _force_min_equals_max(rows, h, "0")
-    write_tsv(p, h, rows)
+    if cc:
+        write_tsv(p, h, rows)
     report.append(f"[affix-max] magicprefix: forced max rolls (rows changed: {cr}, cells: {cc})")
 
 
@@ -557,26 +627,35 @@ def patch_magicsuffix_force_max_rolls(mod_root: Path, report: list[str]) -> None
     """Force max rolls for all magic suffixes (Classic rows: version=0)."""
     rel = Path("data/global/excel/magicsuffix.txt")
     p = mod_root / rel
-    if not p.exists():
+    if not excel_table_exists(p):
         report.append(f"[affix-max] missing {rel} (skipped)")
         return
     h, rows, nl = read_tsv(p)
     cr, cc = _force_min_equals_max(rows, h, "0")
-    write_tsv(p, h, rows)
+    if cc:
+        write_tsv(p, h, rows)
     report.append(f"[affix-max] magicsuffix: forced max rolls (rows changed: {cr}, cells: {cc})")
 
 
-def patch_automagic_force_max_rolls(mod_root: Path, report: list[str]) -> None:
-    """Force max rolls for all automagic entries (Classic rows: version=0)."""
-    rel = Path("data/global/excel/automagic.txt")
-    p = mod_root / rel
-    if not p.exists():
-        report.append(f"[affix-max] missing {rel} (skipped)")
-        return
-    h, rows, nl = read_tsv(p)
+def _automagic_force_max_rows(h: list[str], rows: list[dict[str, str]], report: list[str]) -> int:
+    """Force max rolls for all automagic entries (Classic rows: version=0) in place; returns changed cells."""
     cr, cc = _force_min_equals_max(rows, h, "0")
-    write_tsv(p, h, rows)
     report.append(f"[affix-max] automagic: forced max rolls (rows changed: {cr}, cells: {cc})")
+    return cc
+
+
+def patch_automagic_classic_rolls(mod_root: Path, report: list[str]) -> None:
+    """Classic automagic.txt rolls: forced max rolls, then level/modN copies, on one parse/write."""
+    p = mod_root / "data/global/excel/automagic.txt"
+    if not excel_table_exists(p):
+        report.append("[affix-max] missing data/global/excel/automagic.txt (skipped)")
+        return
+    h, rows, nl = read_tsv(p)
+    max_cells = _automagic_force_max_rows(h, rows, report)
+    cells = max_cells + _automagic_level_rows(h, rows, report)
+    if cells:
+        # Max-roll rewrites are saved with "\n"; a copy-only change keeps the file's own endings.
+        write_tsv(p, h, rows, "\n" if max_cells else nl)
 
 
 def patch_skills_holyshock_min_equals_max(mod_root: Path, report: list[str]) -> None:
@@ -596,103 +675,93 @@ def patch_skills_holyshock_min_equals_max(mod_root: Path, report: list[str]) ->
     """
     rel = Path("data/global/excel/skills.txt")
     p = mod_root / rel
-    if not p.exists():
+    if not excel_table_exists(p):
         report.append(f"[holyshock] missing {rel} (skipped)")
         return
 
     h, rows, _nl = read_tsv(p)
-    hset = set(h)
-
-    def patch_statcalc(stat_prefix: str, calc_prefix: str, max_slots: int) -> tuple[int, int]:
-        """Copy calc for mindam -> maxdam for matching lightning stat pairs within a row."""
-        if stat_prefix + "1" not in hset or calc_prefix + "1" not in hset:
-            return (0, 0)
-
-        rows_changed = 0
-        cells_changed = 0
-
-        for r in rows:
-            # Build map of stat name -> slot index
-            stats = {}
-            for i in range(1, max_slots + 1):
-                sk = f"{stat_prefix}{i}"
-                sv = (r.get(sk) or "").strip().lower()
-                if sv:
-                    stats[sv] = i
-
-            # Patch any '*mindam' -> '*maxdam' pairs
-            row_changed = False
-            for stat_name, i in list(stats.items()):
-                if not stat_name.endswith("mindam"):
-                    continue
-                max_name = stat_name[:-6] + "maxdam"
-                j = stats.get(max_name)
-                if j is None:
-                    continue
-                cmax = (r.get(f"{calc_prefix}{j}") or "").strip()
-                if not cmax:
-                    continue
-                cmin_key = f"{calc_prefix}{i}"
-                if (r.get(cmin_key) or "").strip() != cmax:
-                    r[cmin_key] = cmax
-                    cells_changed += 1
-                    row_changed = True
-
-            if row_changed:
-                rows_changed += 1
+    hset = header_meta(h)["set"]
 
-        return (rows_changed, cells_changed)
+    # Per prefix, the present (slot, stat col, calc col) triples; a prefix without stat1/calc1
+    # takes no calc copies but its stats still count toward the lightning-pair test.
+    def slot_cols(stat_prefix: str, calc_prefix: str, max_slots: int):
+        cols = [(i, f"{stat_prefix}{i}", f"{calc_prefix}{i}") for i in range(1, max_slots + 1)]
+        return cols, (stat_prefix + "1" in hset and calc_prefix + "1" in hset)
 
-    # Pass 1: actual damage via passive/aura calc copies
-    pr, pc = patch_statcalc("passivestat", "passivecalc", 8)
-    ar, ac = patch_statcalc("aurastat", "aurastatcalc", 6)
+    passive_cols, passive_on = slot_cols("passivestat", "passivecalc", 8)
+    aura_cols, aura_on = slot_cols("aurastat", "aurastatcalc", 6)
 
-    # Pass 2: tooltip/display consistency via EMin/EMax pairs on Holy Shock-like rows.
-    # We only apply this for rows where the passive/aura lightning mindam/maxdam pair exists (so we don't touch unrelated skills).
+    # Tooltip/display consistency via EMin/EMax pairs on Holy Shock-like rows.
+    # Header is lowercased once; the EMin scan and EMax lookups both read this map.
     lower_to_header = {c.lower(): c for c in h}
 
-    emin_cols = [c for c in h if c.lower().startswith("emin")]
     display_pairs = []
-    for c in emin_cols:
-        tgt = c.lower().replace("emin", "emax", 1)
+    for cl, c in lower_to_header.items():
+        if not cl.startswith("emin"):
+            continue
+        tgt = cl.replace("emin", "emax", 1)
         if tgt in lower_to_header:
             display_pairs.append((c, lower_to_header[tgt]))
 
-    dr = 0
-    dc = 0
-    if display_pairs:
-        for r in rows:
-            # Detect lightning passive or aura pair in this row
-            has_pair = False
-            for prefix in ("passivestat", "aurastat"):
-                for i in range(1, 9 if prefix=="passivestat" else 7):
-                    s = (r.get(f"{prefix}{i}") or "").strip().lower()
-                    if s == "lightmindam":
-                        # check if any slot contains lightmaxdam
-                        for j in range(1, 9 if prefix=="passivestat" else 7):
-                            if (r.get(f"{prefix}{j}") or "").strip().lower() == "lightmaxdam":
-                                has_pair = True
-                                break
-                    if has_pair:
-                        break
-                if has_pair:
-                    break
-            if not has_pair:
+    def copy_calcs(r, stats: dict[str, int], cols) -> int:
+        """Copy calc for mindam -> maxdam for matching stat pairs within a row; returns cells changed."""
+        n = 0
+        for stat_name, i in stats.items():
+            if not stat_name.endswith("mindam"):
                 continue
+            j = stats.get(stat_name[:-6] + "maxdam")
+            if j is None:
+                continue
+            cmax = (r.get(cols[j - 1][2]) or "").strip()
+            if not cmax:
+                continue
+            cmin_key = cols[i - 1][2]
+            if (r.get(cmin_key) or "").strip() != cmax:
+                r[cmin_key] = cmax
+                n += 1
+        return n
 
-            row_changed = False
-            for emin, emax in display_pairs:
-                mv = (r.get(emax) or "").strip()
-                if not mv:
-                    continue
-                if (r.get(emin) or "").strip() != mv:
-                    r[emin] = mv
-                    dc += 1
-                    row_changed = True
-            if row_changed:
-                dr += 1
+    calc_rows = [0, 0]   # passive, aura
+    calc_cells = [0, 0]
+    dr = dc = 0
+    # One pass per row: stat names are read once per slot and feed both the calc copies
+    # (actual damage) and the lightning-pair gate for the display copies.
+    for r in rows:
+        light_pair = False
+        for k, (cols, on) in enumerate(((passive_cols, passive_on), (aura_cols, aura_on))):
+            stats = {}
+            for i, sk, _ck in cols:
+                sv = r.get(sk)
+                if sv:
+                    sv = sv.strip().lower()
+                    if sv:
+                        stats[sv] = i
+            if "lightmindam" in stats and "lightmaxdam" in stats:
+                light_pair = True
+            if on:
+                n = copy_calcs(r, stats, cols)
+                if n:
+                    calc_rows[k] += 1
+                    calc_cells[k] += n
+
+        # Only rows with a passive/aura lightning mindam/maxdam pair (don't touch unrelated skills).
+        if not light_pair or not display_pairs:
+            continue
+        row_changed = False
+        for emin, emax in display_pairs:
+            mv = (r.get(emax) or "").strip()
+            if not mv:
+                continue
+            if (r.get(emin) or "").strip() != mv:
+                r[emin] = mv
+                dc += 1
+                row_changed = True
+        if row_changed:
+            dr += 1
 
-    write_tsv(p, h, rows)
+    (pr, ar), (pc, ac) = calc_rows, calc_cells
+    if pc or ac or dc:
+        write_tsv(p, h, rows)
     report.append(f"[holyshock] min=max applied: passive(rows={pr},cells={pc}) aura(rows={ar},cells={ac}) display(rows={dr},cells={dc})")
 
 def patch_misc_toa_version0(mod_root: Path, report: list[str]) -> None:
@@ -702,39 +771,31 @@ def patch_misc_toa_version0(mod_root: Path, report: list[str]) -> None:
     """
     rel = Path("data/global/excel/misc.txt")
     path = mod_root / rel
-    if not path.exists():
+    if not excel_table_exists(path):
         report.append(f"[misc] missing {rel} (skipped toa version patch)")
         return
 
-    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    if not lines:
+    tbl = read_dict_tsv(path)
+    if tbl is None:
         report.append("[misc] empty file (skipped toa version patch)")
         return
 
-    delim = "\t" if "\t" in lines[0] else (";" if ";" in lines[0] else "\t")
-    rdr = csv.DictReader(lines, delimiter=delim)
-    if not rdr.fieldnames:
+    delim, fields, rows_in = tbl
+    if not fields:
         report.append("[misc] missing header (skipped toa version patch)")
         return
 
     # Find column names
-    def find_col(fieldnames, want_lower):
-        for c in fieldnames:
-            if c.lower() == want_lower:
-                return c
-        return None
-
-    code_col = find_col(rdr.fieldnames, "code") or rdr.fieldnames[0]
-    ver_col = find_col(rdr.fieldnames, "version")
+    code_col = find_col(fields, "code") or fields[0]
+    ver_col = find_col(fields, "version")
     if ver_col is None:
         report.append("[misc] no 'version' column found (skipped toa version patch)")
         return
 
-    rows = []
+    rows = rows_in
     changed = 0
     found = False
-    for row in rdr:
-        rows.append(row)
+    for row in rows:
         if (row.get(code_col) or "").strip().lower() == "toa":
             found = True
             if (row.get(ver_col) or "").strip() != "0":
@@ -745,11 +806,8 @@ def patch_misc_toa_version0(mod_root: Path, report: list[str]) -> None:
         report.append("[misc] 'toa' row not found (skipped)")
         return
 
-    out = io.StringIO()
-    w = csv.DictWriter(out, fieldnames=rdr.fieldnames, delimiter=delim, lineterminator="\n")
-    w.writeheader()
-    w.writerows(rows)
-    path.write_text(out.getvalue(), encoding="utf-8")
+    if changed:
+        write_dict_tsv(path, fields, rows, delim)
     report.append(f"[misc] classic toa: set version=0 (rows changed: {changed})")
 
 def patch_misc(root: Path, report: list[str]):
@@ -759,12 +817,15 @@ def patch_misc(root: Path, report: list[str]):
         report.append("misc.txt: missing code/maxstack columns, skipped")
         return
     cells = 0
-    for code, val in [("key","50"),("tbk","80"),("ibk","80"),("aqv","500"),("cqv","500")]:
-        for r in d:
-            if r.get("code") == code and r.get("maxstack") != val:
-                r["maxstack"] = val
-                cells += 1
-    write_tsv(p, h, d, nl)
+    # One pass over misc rows with a code -> maxstack lookup (was one full pass per code).
+    maxstack_by_code = {"key": "50", "tbk": "80", "ibk": "80", "aqv": "500", "cqv": "500"}
+    for r in d:
+        val = maxstack_by_code.get(r.get("code"))
+        if val is not None and r.get("maxstack") != val:
+            r["maxstack"] = val
+            cells += 1
+    if cells:
+        write_tsv(p, h, d, nl)
     report.append(f"misc.txt: patched maxstack for key/tbk/ibk/aqv/cqv (cells changed: {cells})")
 
 def patch_showlevel(root: Path, rel: str, report: list[str]):
@@ -780,73 +841,42 @@ def patch_showlevel(root: Path, rel: str, report: list[str]):
         if r.get("ShowLevel") != "1":
             r["ShowLevel"] = "1"
             rc += 1
-    write_tsv(p, h, d, nl)
+    if rc:
+        write_tsv(p, h, d, nl)
     report.append(f"{rel}: set ShowLevel=1 (rows changed: {rc})")
 
-def patch_automagic(root: Path, report: list[str]):
-    p = root/"data/global/excel/automagic.txt"
-    h, d, nl = read_tsv(p)
-    rows_changed = 0
-    cells_changed = 0
-    for r in d:
-        row_changed = False
-        maxlevel = (r.get("maxlevel","") or "").strip()
-        if maxlevel and "level" in h and (r.get("level","") or "").strip() != maxlevel:
-            r["level"] = maxlevel
-            cells_changed += 1
-            row_changed = True
-        for i in range(1, 4):
-            minc, maxc = f"mod{i}min", f"mod{i}max"
-            if minc in h and maxc in h:
-                mx = (r.get(maxc,"") or "").strip()
-                if mx and (r.get(minc,"") or "").strip() != mx:
-                    r[minc] = mx
-                    cells_changed += 1
-                    row_changed = True
-        if row_changed:
-            rows_changed += 1
-    write_tsv(p, h, d, nl)
+def _automagic_level_rows(h: list[str], d: list[dict[str, str]], report: list[str]) -> int:
+    """level=maxlevel and modNmin=modNmax on every automagic row in place; returns changed cells."""
+    hset = header_meta(h)["set"]
+    # (min, max) pairs are fixed per header; resolve them once, not per row
+    pairs = [(mn, mx) for mn, mx in [("level", "maxlevel")] + [(f"mod{i}min", f"mod{i}max") for i in range(1, 4)]
+             if mn in hset and mx in hset]
+    rows_changed, cells_changed = _copy_max_into_min(d, pairs)
     report.append(f"automagic.txt: level=maxlevel and modNmin=modNmax (rows changed: {rows_changed}, cells changed: {cells_changed})")
+    return cells_changed
+
+def _setitems_amin_rows(h: list[str], d: list[dict[str, str]], report: list[str]) -> int:
+    """minN->maxN and aminN->amaxN on every setitems row in place; returns changed cells."""
+    hset = header_meta(h)["set"]
+    pairs = [(c, c.replace("min", "max", 1)) for c in h if _MIN_COL_RE.fullmatch(c)]
+    pairs += [(c, c.replace("amin", "amax", 1)) for c in h if c.startswith("amin")]
+    pairs = [(mn, mx) for mn, mx in pairs if mx in hset]
+    rows_changed, cells_changed = _copy_max_into_min(d, pairs)
+    report.append(f"setitems.txt: min->max and amin->amax (rows changed: {rows_changed}, cells changed: {cells_changed})")
+    return cells_changed
 
-def patch_setitems(root: Path, report: list[str]):
+def patch_setitems_classic_rolls(root: Path, report: list[str]) -> None:
+    """Classic setitems.txt rolls: forced max rolls, then min/amin copies, on one parse/write."""
     p = root/"data/global/excel/setitems.txt"
+    if not excel_table_exists(p):
+        report.append("[set-max] missing data/global/excel/setitems.txt (skipped)")
+        return
     h, d, nl = read_tsv(p)
-    min_cols = [c for c in h if re.fullmatch(r"min\d+", c)]
-    amin_cols = [c for c in h if c.startswith("amin")]
-    rows_changed = 0
-    cells_changed = 0
-    for r in d:
-        row_changed = False
-        for c in min_cols:
-            mx = c.replace("min", "max", 1)
-            if mx in h:
-                mxv = (r.get(mx,"") or "").strip()
-                if mxv and (r.get(c,"") or "").strip() != mxv:
-                    r[c] = mxv
-                    cells_changed += 1
-                    row_changed = True
-        for c in amin_cols:
-            mx = c.replace("amin", "amax", 1)
-            if mx in h:
-                mxv = (r.get(mx,"") or "").strip()
-                if mxv and (r.get(c,"") or "").strip() != mxv:
-                    r[c] = mxv
-                    cells_changed += 1
-                    row_changed = True
-        if row_changed:
-            rows_changed += 1
-    write_tsv(p, h, d, nl)
-    report.append(f"setitems.txt: min->max and amin->amax (rows changed: {rows_changed}, cells changed: {cells_changed})")
-
-def cube_sig(r: dict, cols: list[str]) -> str:
-    inputs = []
-    for k in cols:
-        if k.startswith("input ") and (r.get(k,"") or "").strip():
-            inputs.append((r.get(k,"") or "").strip())
-    inputs_sorted = "|".join(sorted(inputs))
-    s = f"{r.get('op','')}|{r.get('version','')}|{r.get('output','')}|{inputs_sorted}"
-    return hashlib.sha1(s.encode("utf-8")).hexdigest()
-
+    max_cells = _setitems_force_max_rows(h, d, report)
+    cells = max_cells + _setitems_amin_rows(h, d, report)
+    if cells:
+        # Max-roll rewrites are saved with "\n"; a copy-only change keeps the file's own endings.
+        write_tsv(p, h, d, "\n" if max_cells else nl)
 
 def patch_cubemain(root: Path, patch_sources: Path, report: list[str]) -> None:
     """
@@ -865,7 +895,7 @@ def patch_cubemain(root: Path, patch_sources: Path, report: list[str]) -> None:
     dst = root / rel
     src = patch_sources / "cubemain.txt"
 
-    if not dst.exists():
+    if not excel_table_exists(dst):
         report.append("[cubemain] missing cubemain.txt in output (skipped)")
         return
     if not src.exists():
@@ -891,28 +921,44 @@ def patch_cubemain(root: Path, patch_sources: Path, report: list[str]) -> None:
         "lvl", "plvl", "ilvl",
     ]
 
-    common = [c for c in sig_cols if c in h_base and c in h_patch]
+    base_cols = header_meta(h_base)["set"]
+    patch_cols = header_meta(h_patch)["set"]
+    common = [c for c in sig_cols if c in base_cols and c in patch_cols]
     # Fallback if headers differ slightly: include any input/output columns present
     if not common:
         common = [c for c in h_base if c.lower().startswith("input") or c.lower() == "output"]
-        common = [c for c in common if c in h_patch]
+        common = [c for c in common if c in patch_cols]
+
+    common = tuple(common)
+
+    # One C-level multi-key fetch per row; rows from read_tsv (and the variant copies made
+    # from them) carry every header key, so the .get fallback only covers foreign rows.
+    if len(common) > 1:
+        get_common = operator.itemgetter(*common)
+    else:
+        get_common = lambda r: tuple(r[c] for c in common)
 
     def sig(row: dict) -> tuple:
-        return tuple((row.get(c, "") or "").strip() for c in common)
+        try:
+            vals = get_common(row)
+        except KeyError:
+            vals = tuple(row.get(c) for c in common)
+        return tuple((v or "").strip() for v in vals)
 
     base_sigs = {sig(r) for r in d_base}
 
+    check_output = "output" in patch_cols
     to_add = []
     for r in d_patch:
-        # only add enabled rows (enabled == "1")
+        # only add enabled rows (enabled == "1"); cheap filters run before building the signature
         if str(r.get("enabled", "")).strip() != "1":
             continue
+        # ensure the patch row has at least an output field
+        if check_output and (r.get("output") is None or str(r.get("output")).strip() == ""):
+            continue
         s = sig(r)
         if s in base_sigs:
             continue
-        # ensure the patch row has at least an output field
-        if "output" in h_patch and (r.get("output") is None or str(r.get("output")).strip() == ""):
-            continue
         to_add.append(r)
         base_sigs.add(s)
 
@@ -921,7 +967,12 @@ def patch_cubemain(root: Path, patch_sources: Path, report: list[str]) -> None:
         return
 
     # Append patch rows using base header ordering; missing keys become blank
-    out_rows = d_base + [{k: (r.get(k, "") if k in r else "") for k in h_base} for r in to_add]
+    empty = dict.fromkeys(h_base, "")
+    out_rows = list(d_base)
+    for r in to_add:
+        row = empty.copy()
+        row.update((k, r[k]) for k in h_base if k in r)
+        out_rows.append(row)
     write_tsv(dst, h_base, out_rows)
     report.append(f"[cubemain] injected custom recipes (added rows: {len(to_add)})")
 
@@ -955,19 +1006,18 @@ def copy_ui_overrides(root: Path, patch_sources: Path, report: list[str], enable
 
         dst_path = root / rel
         dst_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src_path, dst_path)
+        new_name = None if enable_ui else disabled_name_map.get(dst_path.name)
+        if new_name:
+            # Copy straight to the disabled filename in the same folder (no active override by
+            # default); same result as copy-then-rename, one file write and no rename.
+            if dst_path.exists():
+                dst_path.unlink()
+            shutil.copy2(src_path, dst_path.with_name(new_name))
+            disabled += 1
+        else:
+            shutil.copy2(src_path, dst_path)
         copied += 1
 
-        if not enable_ui:
-            # Rename to disabled filename in the same folder (removes active override by default).
-            new_name = disabled_name_map.get(dst_path.name)
-            if new_name:
-                disabled_path = dst_path.with_name(new_name)
-                if disabled_path.exists():
-                    disabled_path.unlink()
-                dst_path.rename(disabled_path)
-                disabled += 1
-
     if enable_ui:
         report.append(f"[ui] UI overrides enabled: copied {copied} layout json file(s) from patch_sources.")
     else:
@@ -991,7 +1041,7 @@ def find_mod_subroot(static_root: Path) -> Path:
                 return Path("mods") / modname_dir.name / mpq_dir.name
     raise RuntimeError("Could not find mods/<modname>/<modname>.mpq in static_mod; cannot determine mod root.")
 
-PATCHED_TXT_REL = {
+PATCHED_TXT_REL = frozenset({
     "data/global/excel/misc.txt",
     "data/global/excel/cubemain.txt",
     "data/global/excel/armor.txt",
@@ -1000,7 +1050,29 @@ PATCHED_TXT_REL = {
     "data/global/excel/setitems.txt",
     "data/global/excel/uniqueitems.txt",
     "data/global/excel/skills.txt",
-}
+})
+
+def _walk_files(root: Path):
+    """Yield (path, rel_posix) for every file under root; DirEntry type checks avoid an extra stat."""
+    stack = [(str(root), "")]
+    while stack:
+        d, rel = stack.pop()
+        with os.scandir(d) as it:
+            for e in it:
+                sub = f"{rel}/{e.name}" if rel else e.name
+                if e.is_dir(follow_symlinks=False):
+                    stack.append((e.path, sub))
+                elif e.is_file():
+                    yield e.path, sub
+
+def _copy_files(todo: list[tuple[str, Path]]) -> None:
+    """Copy (src, dst) pairs; parents are created once up front, copies overlap on a thread pool."""
+    for parent in {dst.parent for _, dst in todo}:
+        parent.mkdir(parents=True, exist_ok=True)
+    workers = min(32, (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        # list() so a failed copy raises here instead of being dropped
+        list(ex.map(lambda job: shutil.copyfile(*job), todo))
 
 def copy_static_payload(static_root: Path, out_root: Path, mod_subroot: Path, log_lines: list[str]) -> None:
     """
@@ -1010,22 +1082,17 @@ def copy_static_payload(static_root: Path, out_root: Path, mod_subroot: Path, lo
     """
     if not static_root.exists():
         return
-    for p in static_root.rglob("*"):
-        if not p.is_file():
-            continue
-        rel = p.relative_to(static_root)
-        rel_posix = str(rel).replace("\\", "/")
+    prefix = (str(mod_subroot).replace("\\", "/") + "/").lower()
+    skip_rel = frozenset(prefix + t for t in PATCHED_TXT_REL)
+    todo = []
+    for p, rel_posix in _walk_files(static_root):
         # Skip patched txts if present inside the mod root
         # Example static path: mods/qol/qol.mpq/data/global/excel/misc.txt
-        prefix = str(mod_subroot).replace("\\", "/") + "/"
-        if rel_posix.lower().startswith(prefix.lower()):
-            inner = rel_posix[len(prefix):].lower()
-            if inner in PATCHED_TXT_REL:
-                continue
-        dst = out_root / rel
-        dst.parent.mkdir(parents=True, exist_ok=True)
+        if rel_posix.lower() in skip_rel:
+            continue
         # Overwrite static assets (safe), but patched txts are excluded above.
-        dst.write_bytes(p.read_bytes())
+        todo.append((p, out_root / rel_posix))
+    _copy_files(todo)
     log_lines.append(f"[static] copied static_mod into output under {out_root}")
 
 
@@ -1044,19 +1111,47 @@ def sync_output_to_static(out_root: Path, script_dir: Path, mod_subroot: Path, l
         shutil.rmtree(dst)
     dst.mkdir(parents=True, exist_ok=True)
 
-    copied = 0
-    for p in src.rglob("*"):
-        if not p.is_file():
-            continue
-        rel = p.relative_to(src)
-        target = dst / rel
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_bytes(p.read_bytes())
-        copied += 1
+    todo = [(p, dst / rel) for p, rel in _walk_files(src)]
+    _copy_files(todo)
+    copied = len(todo)
 
     log_lines.append(f"[sync] static_mod overwritten with {copied} files from output")
 
 
+@lru_cache(maxsize=8)
+def _read_bytes_cached(path_str: str, mtime_ns: int) -> bytes:
+    return Path(path_str).read_bytes()
+
+def read_bytes_cached(p: Path) -> bytes:
+    """Whole-file bytes, memoized per (path, mtime) so repeat lookups skip the disk read."""
+    return _read_bytes_cached(str(p), p.stat().st_mtime_ns)
+
+
+try:
+    import orjson  # optional: parses bytes directly and much faster than json for the strings files
+except ImportError:
+    orjson = None
+
+def _json_loads_bytes(raw_b: bytes):
+    # Shipped strings files carry a UTF-8 BOM, which neither parser accepts.
+    if raw_b.startswith(b"\xef\xbb\xbf"):
+        raw_b = raw_b[3:]
+    if orjson is not None:
+        return orjson.loads(raw_b)
+    return json.loads(raw_b.decode("utf-8", errors="replace"))
+
+
+@lru_cache(maxsize=8)
+def _json_keys_cached(path_str: str, mtime_ns: int) -> tuple[frozenset, tuple]:
+    arr = _json_loads_bytes(read_bytes_cached(Path(path_str)))
+    keys = tuple(e["Key"] for e in arr if isinstance(e, dict) and isinstance(e.get("Key"), str) and e["Key"])
+    return frozenset(keys), keys
+
+def json_keys_cached(p: Path) -> tuple[frozenset, tuple]:
+    """(set, ordered tuple) of the non-empty "Key" strings in a strings json, parsed once per (path, mtime)."""
+    return _json_keys_cached(str(p), p.stat().st_mtime_ns)
+
+
 def verify_vanilla_item_name_key(vanilla_root: Path, key: str, report: list[str]) -> None:
     """Verify shipped vanilla item-names*.json contains a Key. Does NOT copy or modify strings.
 
@@ -1075,16 +1170,27 @@ def verify_vanilla_item_name_key(vanilla_root: Path, key: str, report: list[str]
             report.append(f"[strings] vanilla missing: {rel.as_posix()} (cannot verify)")
             continue
 
-        raw = p.read_text(encoding="utf-8", errors="replace")
-        if f'"Key": "{key}"' in raw or f'"Key":"{key}"' in raw:
+        # Hit path scans raw bytes; only a miss pays for the decode + JSON parse.
+        raw_b = read_bytes_cached(p)
+        if f'"Key": "{key}"'.encode("utf-8") in raw_b or f'"Key":"{key}"'.encode("utf-8") in raw_b:
             report.append(f"[strings] vanilla contains Key='{key}' in {rel.as_posix()}")
             verified_any = True
             continue
 
         try:
-            arr = json.loads(raw)
-            keys = [e.get("Key") for e in arr if isinstance(e, dict) and isinstance(e.get("Key"), str)]
-            close = [k for k in keys if k and (key.lower().replace(' ', '') in k.lower().replace(' ', '') or k.lower().replace(' ', '') in key.lower().replace(' ', ''))]
+            # Exact Key (formatted differently than the byte needles) is a set probe on the
+            # memoized key list; only a real miss walks the keys for close candidates.
+            key_set, keys = json_keys_cached(p)
+            if key in key_set:
+                report.append(f"[strings] vanilla contains Key='{key}' in {rel.as_posix()}")
+                verified_any = True
+                continue
+            want = key.lower().replace(' ', '')
+            close = []
+            for k in keys:
+                kn = k.lower().replace(' ', '')
+                if want in kn or kn in want:
+                    close.append(k)
             report.append(f"[strings] vanilla does NOT contain Key='{key}' in {rel.as_posix()} (close: {close[:5]})")
         except Exception as ex:
             report.append(f"[strings] failed to parse vanilla {rel.as_posix()} for verification: {ex}")
@@ -1092,57 +1198,31 @@ def verify_vanilla_item_name_key(vanilla_root: Path, key: str, report: list[str]
     if not verified_any:
         report.append(f"[strings] WARNING: Could not verify vanilla Key='{key}' in any item-names*.json")
 
-def apply_remove_unique_level_requirements(mod_root, report):
-    """Remove level requirements for ALL Classic uniques (uniqueitems.txt).
+def _unique_lvlreq_rows(h: list[str], rows: list[dict[str, str]], report: list[str]) -> int:
+    """Remove level requirements for ALL Classic uniques in place.
 
     Sets lvlreq (aka "lvl req") to 0 for every Classic-enabled unique row (version==0 or blank).
     This does not touch base item requirements (armor/weapons), only the unique's required level.
+    Returns changed rows (0 if skipped).
     """
-    p = mod_root / "data/global/excel/uniqueitems.txt"
-    if not p.exists():
-        report.append("[uniq-lvlreq] uniqueitems.txt not found; skipping")
-        return False
-
-    h, rows, _ = read_tsv(p)
-
-    def norm_key(k):
-        return (k or "").strip().lstrip("\ufeff").lower().replace(" ", "")
-
-    def pick(*names):
-        wanted = set(names)
-        for k in h:
-            if norm_key(k) in wanted:
-                return k
-        return None
-
-    ver_key = pick("version")
-    req_key = pick("lvlreq", "levelreq", "reqlevel", "reqlvl", "lvlreq", "lvl req")
+    ver_key = find_first_column(h, "version")
+    req_key = find_first_column(h, "lvlreq", "levelreq", "reqlevel", "reqlvl")
 
     if ver_key is None or req_key is None:
         report.append("[uniq-lvlreq] uniqueitems missing required columns (need version + lvlreq); skipping")
-        return False
-
-    def is_classic(r):
-        v = (r.get(ver_key) or "").strip()
-        return v == "" or v == "0"
+        return 0
 
     changed_rows = 0
-    changed_cells = 0
-    for r in rows:
-        if not is_classic(r):
-            continue
+    for r in rows_with_version(rows, ver_key, CLASSIC_VERSIONS):
         if (r.get(req_key) or "").strip() != "0":
             r[req_key] = "0"
-            changed_cells += 1
             changed_rows += 1
 
     if changed_rows == 0:
         report.append("[uniq-lvlreq] No Classic unique lvlreq values needed changing")
-        return True
-
-    write_tsv(p, h, rows)
-    report.append(f"[uniq-lvlreq] Set lvlreq=0 for {changed_rows} Classic unique row(s)")
-    return True
+    else:
+        report.append(f"[uniq-lvlreq] Set lvlreq=0 for {changed_rows} Classic unique row(s)")
+    return changed_rows
 
 
 
@@ -1172,7 +1252,7 @@ def apply_cow_all_bases(mod_root: Path, report: list[str], enabled: bool, full_c
     p_misc = excel / "misc.txt"
     p_types = excel / "itemtypes.txt"
 
-    if not (p_tc.exists() and p_types.exists()):
+    if not (excel_table_exists(p_tc) and excel_table_exists(p_types)):
         report.append("[cow-all-bases] Missing treasureclassex/itemtypes; skipped")
         return
 
@@ -1180,9 +1260,7 @@ def apply_cow_all_bases(mod_root: Path, report: list[str], enabled: bool, full_c
     orig_tc_len = len(tc_rows)
     tth, type_rows, _ = read_tsv(p_types)
 
-    def normalize_column_key(k): return (k or "").strip().lstrip("\ufeff").lower().replace(" ", "")
-
-    tc_key = next((k for k in th if normalize_column_key(k) in ("treasureclass","treasureclassname","name","tc")), None)
+    tc_key = find_first_column(th, "treasureclass", "treasureclassname", "name", "tc")
     if not tc_key:
         report.append("[cow-all-bases] treasureclassex missing TC name column; skipped")
         return
@@ -1190,7 +1268,7 @@ def apply_cow_all_bases(mod_root: Path, report: list[str], enabled: bool, full_c
     item_cols = [k for k in th if normalize_column_key(k).startswith("item")]
     prob_cols = [k for k in th if normalize_column_key(k).startswith("prob")]
     def _suffix_num(col):
-        m = re.search(r'(\d+)$', normalize_column_key(col))
+        m = _TRAILING_NUM_RE.search(normalize_column_key(col))
         return int(m.group(1)) if m else 0
     item_cols.sort(key=_suffix_num)
     prob_cols.sort(key=_suffix_num)
@@ -1199,15 +1277,15 @@ def apply_cow_all_bases(mod_root: Path, report: list[str], enabled: bool, full_c
         return
     max_slots = min(len(item_cols), len(prob_cols))
 
-    picks_key = next((k for k in th if normalize_column_key(k) in ("picks","pick","pickno")), None)
-    nodrop_key = next((k for k in th if normalize_column_key(k) == "nodrop"), None)
-    group_key = next((k for k in th if normalize_column_key(k) == "group"), None)
-    level_key = next((k for k in th if normalize_column_key(k) in ("level","lvl","tclevel")), None)
+    picks_key = find_first_column(th, "picks", "pick", "pickno")
+    nodrop_key = find_first_column(th, "nodrop")
+    group_key = find_first_column(th, "group")
+    level_key = find_first_column(th, "level", "lvl", "tclevel")
 
     # --- itemtypes: identify Assassin/Druid-restricted types (stay consistent with Classic port layer scope)
     # We keep this intentionally permissive: if we cannot confidently classify, we do NOT skip.
-    type_name_key = next((k for k in tth if normalize_column_key(k) in ("itemtype","type","name")), None)
-    type_class_key = next((k for k in tth if normalize_column_key(k) in ("class","classspecific","itemclass")), None)
+    type_name_key = find_first_column(tth, "itemtype", "type", "name")
+    type_class_key = find_first_column(tth, "class", "classspecific", "itemclass")
 
     type_to_class = {}
     if type_name_key and type_class_key:
@@ -1228,7 +1306,7 @@ def apply_cow_all_bases(mod_root: Path, report: list[str], enabled: bool, full_c
     forge_enabled_base_codes = set()
 
     def _collect_base_codes_from_mappings(path: Path, report_tag: str):
-        if not path.exists():
+        if not excel_table_exists(path):
             report.append(f"[cow-all-bases] {report_tag}: {path.name} not found (skipped)")
             return
         hh, rows, _ = read_tsv(path)
@@ -1243,17 +1321,13 @@ def apply_cow_all_bases(mod_root: Path, report: list[str], enabled: bool, full_c
             report.append(f"[cow-all-bases] {report_tag}: {path.name} missing code/item column (skipped)")
             return
 
-        def _is_classic_enabled(r):
-            v = (r.get(ver_k) or "").strip() if ver_k else ""
-            e = (r.get(en_k) or "").strip() if en_k else ""
-            is_classic = (v == "" or v == "0")
-            is_enabled = (e == "" or e == "1")  # some tables leave enabled blank
-            return is_classic and is_enabled
+        # Classic rows (version blank/0) that are enabled; some tables leave enabled blank.
+        scoped = rows_with_version(rows, ver_k, CLASSIC_VERSIONS) if ver_k else rows
+        if en_k:
+            scoped = rows_with_version(scoped, en_k, ("", "1"))
 
         n = 0
-        for r in rows:
-            if not _is_classic_enabled(r):
-                continue
+        for r in scoped:
             c = (r.get(base_k) or "").strip().lower()
             if c:
                 forge_enabled_base_codes.add(c)
@@ -1267,7 +1341,7 @@ def apply_cow_all_bases(mod_root: Path, report: list[str], enabled: bool, full_c
     # --- Collect base codes from armor/weapons/misc (spawnable when possible)
     base_codes = {}  # code -> (type, type2)
     def ingest_base_table(path: Path):
-        if not path.exists():
+        if not excel_table_exists(path):
             return
         hh, rows, _ = read_tsv(path)
         code_k = find_column_by_name(hh, "code")
@@ -1322,25 +1396,27 @@ def apply_cow_all_bases(mod_root: Path, report: list[str], enabled: bool, full_c
             return "exceptional"
         return "normal"
 
-    normal_codes = [c for c in all_codes if tier(c)=="normal"]
-    excep_codes  = [c for c in all_codes if tier(c)=="exceptional"]
-    elite_codes  = [c for c in all_codes if tier(c)=="elite"]
+    def split_tiers(codes: list[str]) -> tuple[list[str], list[str], list[str]]:
+        # One pass over the codes; each keeps its relative order within its tier.
+        by_tier = {"normal": [], "exceptional": [], "elite": []}
+        for c in codes:
+            by_tier[tier(c)].append(c)
+        return by_tier["normal"], by_tier["exceptional"], by_tier["elite"]
 
     # Helper: create a TC row (dictionary) with default keys present
+    empty_tc_row = dict.fromkeys(th, "")
+    tc_slots = list(zip(item_cols, prob_cols))[:max_slots]
     def make_tc_row(name: str, items: list[str], probs: list[int]):
-        r = {k:"" for k in th}
+        r = empty_tc_row.copy()
         r[tc_key] = name
         if picks_key: r[picks_key] = "1"
         if nodrop_key: r[nodrop_key] = "0"
         if group_key: r[group_key] = "0"
         if level_key: r[level_key] = "0"
-        for i in range(max_slots):
-            if i < len(items):
-                r[item_cols[i]] = items[i]
-                r[prob_cols[i]] = str(probs[i] if i < len(probs) else 1)
-            else:
-                r[item_cols[i]] = ""
-                r[prob_cols[i]] = ""
+        # Slots past len(items) are already blank in the template; only filled slots are written.
+        for i, (ic, pc) in enumerate(tc_slots[:len(items)]):
+            r[ic] = items[i]
+            r[pc] = str(probs[i] if i < len(probs) else 1)
         return r
 
     # Build a balanced tree of sub-TCs to overcome slot limits
@@ -1382,10 +1458,8 @@ def apply_cow_all_bases(mod_root: Path, report: list[str], enabled: bool, full_c
     if removed_unsafe:
         report.append(f"[cow-all-bases] filtered {removed_unsafe} classic-unsafe base code(s) by type (banned={sorted(banned_types)})")
 
-    # Re-split tiers after filtering
-    normal_codes = [c for c in all_codes if tier(c)=="normal"]
-    excep_codes  = [c for c in all_codes if tier(c)=="exceptional"]
-    elite_codes  = [c for c in all_codes if tier(c)=="elite"]
+    # Split tiers once, after all filtering
+    normal_codes, excep_codes, elite_codes = split_tiers(all_codes)
     def unique_name(base: str) -> str:
         n = base
         i = 1
@@ -1505,8 +1579,7 @@ def apply_cow_all_bases(mod_root: Path, report: list[str], enabled: bool, full_c
     # Patch cow rows: add one reference to wrapper based on name
     cow_rows = []
     for _r in tc_rows:
-        _name = (_r.get(tc_key) or "")
-        _nl = _name.lower()
+        _nl = (_r.get(tc_key) or "").lower()
         # Only patch ORIGINAL cow TCs. Exclude any zz_* helper TCs we just created to avoid self-references.
         if "cow" not in _nl:
             continue
@@ -1542,6 +1615,9 @@ def apply_cow_all_bases(mod_root: Path, report: list[str], enabled: bool, full_c
     if wrap_prob < 1: wrap_prob = 1
     if wrap_prob > 32767: wrap_prob = 32767
     injected = 0
+    # Slot pairs and the prob cell value are loop-invariant; build them once for all cow rows.
+    slots = list(zip(item_cols, prob_cols))
+    wrap_prob_s = str(wrap_prob)
     for r in cow_rows:
         name = (r.get(tc_key) or "")
         n = name.lower()
@@ -1554,11 +1630,12 @@ def apply_cow_all_bases(mod_root: Path, report: list[str], enabled: bool, full_c
         elif "(h)" in n or " hell" in n:
             wrapper = wrap_H
         # place into first empty slot
-        for ic, pc in zip(item_cols, prob_cols):
-            if (r.get(ic) or "").strip() != "":
+        get = r.get
+        for ic, pc in slots:
+            if (get(ic) or "").strip() != "":
                 continue
             r[ic] = wrapper
-            r[pc] = str(wrap_prob)
+            r[pc] = wrap_prob_s
             injected += 1
             break
 
@@ -1594,7 +1671,7 @@ def apply_tc_enrichment_highlevel_bases(mod_root: Path, report: list[str], enabl
     p_misc = excel / "misc.txt"
     p_types = excel / "itemtypes.txt"
 
-    if not (p_tc.exists() and p_uni.exists() and p_types.exists()):
+    if not (excel_table_exists(p_tc) and excel_table_exists(p_uni) and excel_table_exists(p_types)):
         report.append("[tc-enrichment] Missing treasureclassex/uniqueitems/itemtypes; skipped")
         return
 
@@ -1602,16 +1679,14 @@ def apply_tc_enrichment_highlevel_bases(mod_root: Path, report: list[str], enabl
     uh, urows, _ = read_tsv(p_uni)
     hh, type_rows, _ = read_tsv(p_types)
 
-    def normalize_column_key(k): return (k or "").strip().lstrip("\ufeff").lower().replace(" ", "")
-
-    tc_key = next((k for k in th if normalize_column_key(k) in ("treasureclass","treasureclassname","name","tc")), None)
-    lvl_key = next((k for k in th if normalize_column_key(k) in ("level","lvl","tclevel")), None)
+    tc_key = find_first_column(th, "treasureclass", "treasureclassname", "name", "tc")
+    lvl_key = find_first_column(th, "level", "lvl", "tclevel")
 
     item_cols = [k for k in th if normalize_column_key(k).startswith("item")]
     prob_cols = [k for k in th if normalize_column_key(k).startswith("prob")]
 
     def _suffix_num(col):
-        m = re.search(r'(\d+)$', normalize_column_key(col))
+        m = _TRAILING_NUM_RE.search(normalize_column_key(col))
         return int(m.group(1)) if m else 0
 
     item_cols.sort(key=_suffix_num)
@@ -1625,7 +1700,7 @@ def apply_tc_enrichment_highlevel_bases(mod_root: Path, report: list[str], enabl
     base_index = {}
     base_tables = {}
     def index_base_table(p: Path):
-        if not p.exists():
+        if not excel_table_exists(p):
             return
         h, rows, _ = read_tsv(p)
         col_code = find_column_by_name(h, "code")
@@ -1646,8 +1721,8 @@ def apply_tc_enrichment_highlevel_bases(mod_root: Path, report: list[str], enabl
     index_base_table(p_misc)
 
     # Identify Assassin/Druid restricted item type codes from itemtypes.txt
-    col_type_code = next((k for k in hh if normalize_column_key(k) in ("code","itemtype","type","itemtypecode")), None)
-    col_class = next((k for k in hh if normalize_column_key(k) in ("class","equiv1","playerclass")), None)
+    col_type_code = find_first_column(hh, "code", "itemtype", "type", "itemtypecode")
+    col_class = find_first_column(hh, "class", "equiv1", "playerclass")
     # In most schemas, 'Class' exists; if not, we fall back to skipping nothing (but Classic port layer already excluded those uniques).
     restricted_type_codes = set()
     if col_type_code and col_class:
@@ -1656,21 +1731,10 @@ def apply_tc_enrichment_highlevel_bases(mod_root: Path, report: list[str], enabl
             if cls in ("ass", "dru"):
                 restricted_type_codes.add((r.get(col_type_code) or "").strip())
 
-    def is_restricted_base(code_item: str) -> bool:
-        code_item = (code_item or "").strip().lower()
-        if code_item not in base_index:
-            return False
-        fname, ridx = base_index[code_item]
-        p, h, rows, col_code, col_type, col_type2 = base_tables[fname]
-        br = rows[ridx]
-        t1 = (br.get(col_type) or "").strip()
-        t2 = (br.get(col_type2) or "").strip()
-        return (t1 in restricted_type_codes) or (t2 in restricted_type_codes)
-
     # Collect eligible base codes from Classic-enabled uniques (exclude ass/dru locked bases)
     ver_key = find_column_by_name(uh, "version")
     code_key = find_column_by_name(uh, "code")
-    en_key = next((k for k in uh if normalize_column_key(k) in ("enabled","enabled1")), None)
+    en_key = find_first_column(uh, "enabled", "enabled1")
 
     if not ver_key or not code_key:
         report.append("[tc-enrichment] uniqueitems missing version/code; skipped")
@@ -1678,19 +1742,21 @@ def apply_tc_enrichment_highlevel_bases(mod_root: Path, report: list[str], enabl
 
     eligible = []
     seen = set()
-    for r in urows:
-        v = (r.get(ver_key) or "").strip()
-        if v not in ("", "0"):
-            continue
-        if en_key:
-            ev = (r.get(en_key) or "").strip()
-            if ev not in ("", "1"):
-                continue
+    scoped = rows_with_version(urows, ver_key, CLASSIC_VERSIONS)
+    if en_key:
+        scoped = rows_with_version(scoped, en_key, ("", "1"))
+    for r in scoped:
         c = (r.get(code_key) or "").strip().lower()
         if not c or c in seen:
             continue
-        if is_restricted_base(c):
-            continue
+        # exclude ass/dru class-locked bases (inlined: runs once per Classic unique)
+        bi = base_index.get(c)
+        if bi is not None:
+            _p, _h, rows_b, _col_code, col_type, col_type2 = base_tables[bi[0]]
+            br = rows_b[bi[1]]
+            if ((br.get(col_type) or "").strip() in restricted_type_codes
+                    or (br.get(col_type2) or "").strip() in restricted_type_codes):
+                continue
         seen.add(c)
         eligible.append(c)
 
@@ -1703,8 +1769,7 @@ def apply_tc_enrichment_highlevel_bases(mod_root: Path, report: list[str], enabl
     before_unsafe = len(eligible)
     eligible2 = []
     for c in eligible:
-        if is_restricted_base(c):
-            continue
+        # (restricted bases were already dropped while building `eligible`)
         bi = base_index.get(c)
         if not bi:
             continue
@@ -1732,8 +1797,10 @@ def apply_tc_enrichment_highlevel_bases(mod_root: Path, report: list[str], enabl
     PROB = "1"      # conservative weight comparable to existing high-level probs
     PROB_FOCUS = "2"
 
-    focus = [c for c in ["uar","uap","9wd","xap","ring","amul"] if c in set(eligible_sorted) or c in ("ring","amul")]
-    stream = focus + [c for c in eligible_sorted if c not in set(focus)]
+    eligible_set = set(eligible_sorted)
+    focus = [c for c in ["uar","uap","9wd","xap","ring","amul"] if c in eligible_set or c in ("ring","amul")]
+    focus_set = set(focus)
+    stream = focus + [c for c in eligible_sorted if c not in focus_set]
 
     injected = 0
     tcs_touched = 0
@@ -1756,7 +1823,7 @@ def apply_tc_enrichment_highlevel_bases(mod_root: Path, report: list[str], enabl
             if i >= len(stream):
                 break
             r[ic] = stream[i]
-            r[pc] = PROB_FOCUS if stream[i] in focus else PROB
+            r[pc] = PROB_FOCUS if stream[i] in focus_set else PROB
             i += 1
             placed += 1
             injected += 1
@@ -1782,14 +1849,13 @@ def apply_post_unique_maxrolls_for_targets(mod_root: Path, report: list[str], ta
     """
     rel = Path("data/global/excel/uniqueitems.txt")
     p = mod_root / rel
-    if not p.exists():
+    if not excel_table_exists(p):
         report.append(f"[uni-max-post] missing {rel} (skipped)")
         return
 
     h, rows, _ = read_tsv(p)
 
-    def normalize_column_key(k): return (k or "").strip().lstrip("\ufeff").lower().replace(" ", "")
-    index_key = next((k for k in h if normalize_column_key(k)=="index"), None)
+    index_key = find_first_column(h, "index")
     name_key  = find_column_by_name(h, "name")
     id_keys = [k for k in (index_key, name_key) if k]
 
@@ -1797,18 +1863,15 @@ def apply_post_unique_maxrolls_for_targets(mod_root: Path, report: list[str], ta
         report.append("[uni-max-post] uniqueitems missing index/name columns (skipped)")
         return
 
-    targets = set([t.strip().lower() for t in target_names if t and t.strip()])
-    min_cols = [c for c in h if c.lower().startswith("min") and c[3:].isdigit()]
+    targets = frozenset(sys.intern(t.strip().lower()) for t in target_names if t and t.strip())
+    min_cols = [c for c in h if _MINN_RE.match(c)]
     if not min_cols:
         report.append("[uni-max-post] no min/max columns found (skipped)")
         return
 
-    changed_cells = 0
-    changed_rows = 0
-
-    for r in rows:
-        if (r.get("version") or "").strip() != "0":
-            continue
+    # Index Classic rows once by their id (index, else name), then pull only the targets.
+    by_id: dict[str, list[dict]] = {}
+    for r in rows_with_version(rows, "version", ("0",)):
         # match by index or name
         rid = ""
         for k in id_keys:
@@ -1816,23 +1879,12 @@ def apply_post_unique_maxrolls_for_targets(mod_root: Path, report: list[str], ta
             if v:
                 rid=v
                 break
-        if rid not in targets:
-            continue
+        by_id.setdefault(rid, []).append(r)
+    target_rows = [r for t in targets for r in by_id.get(t, ())]
 
-        row_changed=False
-        for c in min_cols:
-            mx="max"+c[3:]
-            if mx not in h:
-                continue
-            mxv=(r.get(mx,"") or "").strip()
-            if not mxv:
-                continue
-            if (r.get(c,"") or "").strip()!=mxv:
-                r[c]=mxv
-                changed_cells+=1
-                row_changed=True
-        if row_changed:
-            changed_rows+=1
+    hset = header_meta(h)["set"]
+    pairs = [(c, "max" + c[3:]) for c in min_cols if "max" + c[3:] in hset]
+    changed_rows, changed_cells = _copy_max_into_min(target_rows, pairs)
 
     if changed_rows:
         write_tsv(p, h, rows)
@@ -1846,16 +1898,16 @@ def add_low_quality_variants_cubemain(rows, header, report):
     - uar-specific: if any recipe input references Sacred Armor (uar) with nor/hiq/low, ensure all three variants exist.
       This fixes Superior Sacred Armor (hiq) not matching when only nor was present.
     """
-    def normalize_column_key(k):
-        return (k or "").strip().lstrip("\ufeff").lower().replace(" ", "")
     in_cols = [k for k in header if normalize_column_key(k).startswith("input")]
     if not in_cols:
         return 0
 
+    sig_cols = ("output", *in_cols)
+
     def sig(r):
-        out = (r.get("output") or "")
-        parts = [out] + [(r.get(c) or "") for c in in_cols]
-        return "|".join(parts)
+        # Tuple key: no list + join per call, and no ambiguity if a cell ever contains "|".
+        get = r.get
+        return tuple(get(c) or "" for c in sig_cols)
 
     def normalize_uar(v, target):
         if "uar," not in v:
@@ -1864,39 +1916,43 @@ def add_low_quality_variants_cubemain(rows, header, report):
         return v2.replace("uar,TGT,nos", "uar,"+target+",nos")
 
     seen=set()
-    base=list(rows)
+    seen_add=seen.add
     new_rows=[]
-    for r in base:
+    for r in rows:
         s=sig(r)
         if s not in seen:
-            seen.add(s)
+            seen_add(s)
             new_rows.append(r)
 
+    # Variants are computed as input-cell lists and signed from those; the row dict is only
+    # copied when the signature is new.
     for r in list(new_rows):
+        out=(r.get("output") or "")
+        vals=[(r.get(c) or "") for c in in_cols]
+
         # generic low sibling
-        low_r=dict(r)
-        any_change=False
-        for c in in_cols:
-            v=(low_r.get(c) or "")
+        low_over={}
+        for c, v in zip(in_cols, vals):
             if ",nor,nos" in v or ",hiq,nos" in v:
-                low_r[c]=v.replace(",nor,nos",",low,nos").replace(",hiq,nos",",low,nos")
-                any_change=True
-        if any_change:
-            s=sig(low_r)
+                low_over[c]=v.replace(",nor,nos",",low,nos").replace(",hiq,nos",",low,nos")
+        if low_over:
+            s=(out, *[low_over.get(c, v) for c, v in zip(in_cols, vals)])
             if s not in seen:
-                seen.add(s)
+                seen_add(s)
+                low_r=dict(r)
+                low_r.update(low_over)
                 new_rows.append(low_r)
 
         # uar-specific variants
-        joined=" ".join((r.get(c) or "") for c in in_cols)
-        if "uar,nor,nos" in joined or "uar,hiq,nos" in joined or "uar,low,nos" in joined:
+        # Short-circuits on the first matching input; no joined copy of the inputs.
+        if any("uar,nor,nos" in v or "uar,hiq,nos" in v or "uar,low,nos" in v for v in vals):
             for target in ("nor","hiq","low"):
-                vr=dict(r)
-                for c in in_cols:
-                    vr[c]=normalize_uar(vr.get(c) or "", target)
-                s=sig(vr)
+                uvals=[normalize_uar(v, target) for v in vals]
+                s=(out, *uvals)
                 if s not in seen:
-                    seen.add(s)
+                    seen_add(s)
+                    vr=dict(r)
+                    vr.update(zip(in_cols, uvals))
                     new_rows.append(vr)
 
     delta=len(new_rows)-len(rows)
@@ -1920,11 +1976,11 @@ def validate_uniqueitems_invariants(mod_root, report):
         raise RuntimeError("PATCHER ASSERTION FAILED: _VANILLA_ROOT not set; cannot validate uniqueitems invariants.")
     vp = _VANILLA_ROOT / "data/global/excel/uniqueitems.txt"
     mp = mod_root / "data/global/excel/uniqueitems.txt"
-    if not vp.exists() or not mp.exists():
+    if not vp.exists() or not excel_table_exists(mp):
         report.append("[uniqueitems-guard] missing vanilla or mod uniqueitems.txt; skipped")
         return False
 
-    vh, vrows, _ = read_tsv(vp)
+    vh, vrows, _ = read_vanilla_tsv("data/global/excel/uniqueitems.txt")
     mh, mrows, _ = read_tsv(mp)
 
     if vh != mh:
@@ -1973,22 +2029,23 @@ def apply_classic_unique_port_layer(mod_root: Path, report: list[str], strict: b
     excel = mod_root / "data/global/excel"
     p_uni = excel / "uniqueitems.txt"
     p_types = excel / "itemtypes.txt"
-    if not p_uni.exists():
+    if not excel_table_exists(p_uni):
         raise RuntimeError("uniqueitems.txt not found in mod tree: " + str(p_uni))
-    if not p_types.exists():
+    if not excel_table_exists(p_types):
         raise RuntimeError("itemtypes.txt not found in mod tree: " + str(p_types))
 
     # --- load itemtypes -> restricted type codes (ass/dru) ---
     h_t, rows_t, _ = read_tsv(p_types)
-    def normalize_column_key(k): return (k or "").strip().lstrip("\ufeff").lower().replace(" ", "")
-    col_type_code = next((k for k in h_t if normalize_column_key(k) in ("code",)), None)
-    col_class = next((k for k in h_t if normalize_column_key(k) in ("class",)), None)
+    col_type_code = find_first_column(h_t, "code")
+    col_class = find_first_column(h_t, "class")
     if col_type_code is None or col_class is None:
         raise RuntimeError("PATCHER ASSERTION FAILED: itemtypes.txt missing Code/Class columns; cannot exclude ass/dru uniques safely.")
     restricted_type_codes = set()
+    type_code_to_class = {}  # first occurrence wins (used for ass/dru skip reporting)
     for r in rows_t:
         cls = (r.get(col_class) or "").strip().lower()
         tcode = (r.get(col_type_code) or "").strip()
+        type_code_to_class.setdefault(tcode, cls)
         if tcode and cls in ("ass", "dru"):
             restricted_type_codes.add(tcode)
 
@@ -1998,7 +2055,7 @@ def apply_classic_unique_port_layer(mod_root: Path, report: list[str], strict: b
 
     def load_base_table(fname: str):
         p = excel / fname
-        if not p.exists():
+        if not excel_table_exists(p):
             return
         h, rows, _ = read_tsv(p)
         # find columns
@@ -2022,10 +2079,10 @@ def apply_classic_unique_port_layer(mod_root: Path, report: list[str], strict: b
 
     # --- load uniqueitems ---
     h_u, rows_u, _ = read_tsv(p_uni)
-    col_u_idx = next((k for k in h_u if normalize_column_key(k)=="index"), None)
+    col_u_idx = find_first_column(h_u, "index")
     col_u_code= find_column_by_name(h_u, "code")
     col_u_ver = find_column_by_name(h_u, "version")
-    col_u_en  = next((k for k in h_u if normalize_column_key(k)=="enabled"), None)
+    col_u_en  = find_first_column(h_u, "enabled")
     if col_u_idx is None or col_u_code is None or col_u_ver is None:
         raise RuntimeError("PATCHER ASSERTION FAILED: uniqueitems missing index/code/version columns.")
 
@@ -2056,17 +2113,6 @@ def apply_classic_unique_port_layer(mod_root: Path, report: list[str], strict: b
     # do NOT get ported/enabled in Classic++ until Phase 2.
     excluded_skilltab_ids = {"15", "16", "17", "18", "19", "20"}
 
-    def is_restricted_base(code: str) -> bool:
-        rec = base_index.get(code)
-        if not rec:
-            return False
-        fname, ridx = rec
-        p, h, rows, col_code, col_ver, col_spawn, col_type, col_type2 = base_tables[fname]
-        r = rows[ridx]
-        t1 = (r.get(col_type) or "").strip() if col_type else ""
-        t2 = (r.get(col_type2) or "").strip() if col_type2 else ""
-        return (t1 in restricted_type_codes) or (t2 in restricted_type_codes)
-
     enabled_uniques = 0
     enabled_bases = 0
     skipped_ass = 0
@@ -2089,39 +2135,32 @@ def apply_classic_unique_port_layer(mod_root: Path, report: list[str], strict: b
             continue
 
         # Exclude Assassin/Druid uniques by *properties* (complements base-type exclusion).
+        # Each prop cell is normalized once per row and shared by the checks below.
+        tok_of = {pc: (r.get(pc) or "").strip().lower() for pc in prop_cols}
         # First, direct tokens (propN = dru/ass).
-        hit_token = None
-        for pc in prop_cols:
-            tok = (r.get(pc) or "").strip().lower()
-            if tok in excluded_class_prop_tokens:
-                hit_token = tok
-                break
+        hit_token = next((tok for tok in tok_of.values() if tok in excluded_class_prop_tokens), None)
         # Second, generic class-skill property (propN=item_addclassskills, parN = class id).
-        if hit_token is None:
-            for n, pc in prop_num_to_col.items():
-                tok = (r.get(pc) or "").strip().lower()
-                if tok != "item_addclassskills":
-                    continue
-                parc = par_num_to_col.get(n)
-                parv = (r.get(parc) or "").strip() if parc else ""
-                mapped = excluded_class_ids.get(parv)
-                if mapped:
-                    hit_token = mapped
-                    break
-
         # Third, tab-skill property (propN=item_addskilltab, parN = skilltab id).
         # This is how many uniques encode "+X to <Skill Tree>" bonuses.
+        # Both are scanned in one pass; a class-skill hit still wins over a tab-skill hit.
         if hit_token is None:
+            class_hit = None
+            tab_hit = None
             for n, pc in prop_num_to_col.items():
-                tok = (r.get(pc) or "").strip().lower()
-                if tok != "item_addskilltab":
-                    continue
-                parc = par_num_to_col.get(n)
-                parv = (r.get(parc) or "").strip() if parc else ""
-                if parv in excluded_skilltab_ids:
-                    # Map to class for reporting only
-                    hit_token = "dru" if parv in {"15", "16", "17"} else "ass"
-                    break
+                tok = tok_of[pc]
+                if tok == "item_addclassskills":
+                    parc = par_num_to_col.get(n)
+                    parv = (r.get(parc) or "").strip() if parc else ""
+                    class_hit = excluded_class_ids.get(parv)
+                    if class_hit:
+                        break
+                elif tok == "item_addskilltab" and tab_hit is None:
+                    parc = par_num_to_col.get(n)
+                    parv = (r.get(parc) or "").strip() if parc else ""
+                    if parv in excluded_skilltab_ids:
+                        # Map to class for reporting only
+                        tab_hit = "dru" if parv in {"15", "16", "17"} else "ass"
+            hit_token = class_hit or tab_hit
 
         if hit_token == "dru":
             skipped_dru_prop += 1
@@ -2141,27 +2180,25 @@ def apply_classic_unique_port_layer(mod_root: Path, report: list[str], strict: b
         fname, ridx = rec
         p_b, h_b, rows_b, col_code_b, col_ver_b, col_spawn_b, col_type_b, col_type2_b = base_tables[fname]
         br_b = rows_b[ridx]
-        t1_b = (br_b.get(col_type_b) or "").strip().lower() if col_type_b else ""
-        t2_b = (br_b.get(col_type2_b) or "").strip().lower() if col_type2_b else ""
+        # Base type cells are normalized once here and reused by both exclusion checks below.
+        t1 = (br_b.get(col_type_b) or "").strip() if col_type_b else ""
+        t2 = (br_b.get(col_type2_b) or "").strip() if col_type2_b else ""
+        t1_b = t1.lower()
+        t2_b = t2.lower()
         if t1_b in banned_misc_types or t2_b in banned_misc_types:
             skipped_unsafe_misc += 1
             skipped_by_prop.append((idx, t1_b if t1_b in banned_misc_types else t2_b))
             continue
 
         # exclude assassin/druid class-locked bases
-        if is_restricted_base(code_item):
+        if t1 in restricted_type_codes or t2 in restricted_type_codes:
             # classify as ass/dru for reporting (best-effort)
-            fname, ridx = rec
-            p, h, rows, col_code, col_ver, col_spawn, col_type, col_type2 = base_tables[fname]
-            br = rows[ridx]
-            t1 = (br.get(col_type) or "").strip() if col_type else ""
-            t2 = (br.get(col_type2) or "").strip() if col_type2 else ""
             cls = None
             if t1 in restricted_type_codes:
                 # find which
-                cls = next(( (rr.get(col_class) or "").strip().lower() for rr in rows_t if (rr.get(col_type_code) or "").strip()==t1 ), None)
+                cls = type_code_to_class.get(t1)
             if cls is None and t2 in restricted_type_codes:
-                cls = next(( (rr.get(col_class) or "").strip().lower() for rr in rows_t if (rr.get(col_type_code) or "").strip()==t2 ), None)
+                cls = type_code_to_class.get(t2)
             if cls == "dru":
                 skipped_dru += 1
             else:
@@ -2228,18 +2265,15 @@ def patch_relax_item_requirements(mod_root: Path, report: list[str]) -> None:
     """
     excel = mod_root / "data" / "global" / "excel"
 
-    def _nk(k: str) -> str:
-        return (k or "").strip().lstrip("\ufeff").lower().replace(" ", "")
-
     def _relax_table(path: Path, tag: str) -> tuple[int, int]:
-        if not path.exists():
+        if not excel_table_exists(path):
             report.append(f"[req-relax] {tag}: missing {path.name}; skipped")
             return (0, 0)
         hh, rows, _ = read_tsv(path)
-        ver_k = next((k for k in hh if _nk(k) == "version"), None)
-        lvl_k = next((k for k in hh if _nk(k) in ("levelreq", "lvlreq")), None)
-        str_k = next((k for k in hh if _nk(k) in ("reqstr", "reqstrength")), None)
-        dex_k = next((k for k in hh if _nk(k) in ("reqdex", "reqdexterity")), None)
+        ver_k = find_first_column(hh, "version")
+        lvl_k = find_first_column(hh, "levelreq", "lvlreq")
+        str_k = find_first_column(hh, "reqstr", "reqstrength")
+        dex_k = find_first_column(hh, "reqdex", "reqdexterity")
 
         if not (lvl_k or str_k or dex_k):
             report.append(f"[req-relax] {tag}: no requirement columns found; skipped")
@@ -2247,14 +2281,8 @@ def patch_relax_item_requirements(mod_root: Path, report: list[str]) -> None:
 
         rows_changed = 0
         cells_changed = 0
-        for r in rows:
-            # skip expansion marker row and non-classic rows
-            if ver_k:
-                v = (r.get(ver_k) or "").strip()
-                if v.lower() == "expansion":
-                    continue
-                if v not in ("", "0"):
-                    continue
+        # skip expansion marker row and non-classic rows (pre-bucketed once)
+        for r in (rows_with_version(rows, ver_k, CLASSIC_VERSIONS) if ver_k else rows):
             changed_this_row = False
             for k in (lvl_k, str_k, dex_k):
                 if not k:
@@ -2276,6 +2304,67 @@ def patch_relax_item_requirements(mod_root: Path, report: list[str]) -> None:
     _relax_table(excel / "weapons.txt", "weap")
 
 
+def _run_patch_lane(steps):
+    """Run (fn, args, kwargs) steps in order; returns one report list per step (pool worker entry)."""
+    reports = []
+    for fn, args, kwargs in steps:
+        step_report = []
+        fn(*args, step_report, **kwargs)
+        reports.append(step_report)
+    return reports
+
+
+def run_patch_steps(steps, report: list[str], jobs: int = 1) -> None:
+    """Run pipeline steps [(lane, fn, args, kwargs)]; fn is called as fn(*args, report, **kwargs).
+
+    jobs <= 1 runs everything serially in list order. Otherwise the "main" lane runs here
+    (it needs _VANILLA_ROOT) while each other lane runs in a ProcessPoolExecutor worker; the
+    per-step report lines are then appended in the original step order. A failed worker lane
+    is re-raised as soon as it is seen (checked between main-lane steps and as lanes finish),
+    and lanes that have not started are cancelled.
+    """
+    if jobs <= 1:
+        for _lane, fn, args, kwargs in steps:
+            fn(*args, report, **kwargs)
+        return
+
+    lanes = {}
+    for i, (lane, fn, args, kwargs) in enumerate(steps):
+        lanes.setdefault(lane, []).append((i, (fn, args, kwargs)))
+
+    step_reports = [None] * len(steps)
+    # One worker per lane is the most that can be busy at once.
+    workers = min(jobs, max(1, len(lanes) - ("main" in lanes)))
+    ex = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = {
+            ex.submit(_run_patch_lane, [step for _, step in items]): lane
+            for lane, items in lanes.items()
+            if lane != "main"
+        }
+
+        def collect(fut) -> None:
+            # .result() re-raises the worker's exception
+            for (i, _), step_report in zip(lanes[futures[fut]], fut.result()):
+                step_reports[i] = step_report
+
+        pending = set(futures)
+        for i, (fn, args, kwargs) in lanes.get("main", []):
+            step_report = []
+            fn(*args, step_report, **kwargs)
+            step_reports[i] = step_report
+            for fut in [f for f in pending if f.done()]:
+                pending.discard(fut)
+                collect(fut)
+        for fut in as_completed(pending):
+            collect(fut)
+    finally:
+        ex.shutdown(wait=True, cancel_futures=True)
+
+    for step_report in step_reports:
+        report.extend(step_report)
+
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--vanilla", required=True, help="Path to vanilla dump root containing data/ ...")
@@ -2290,6 +2379,11 @@ def main():
         help="Enable Expansion (LoD) base items to drop naturally in Classic via TreasureClassEx integration (safe: fills empty slots only; no NoDrop/Picks changes).",
     )
     ap.add_argument("--enable-ui", action="store_true", help="Enable UI layout json overrides (default is disabled: files are renamed to disable*).")
+    ap.add_argument("--jobs", type=int, default=1,
+                    help="Worker processes for patch steps that own a table nobody else touches (default 1 = serial, 0 = CPU count).")
+    ap.add_argument("--link-vanilla-excel", action="store_true",
+                    help="Seed excel tables as hard links to the vanilla dump instead of copies (same volume only). "
+                         "Patched tables are rewritten as new files; untouched ones stay linked to vanilla.")
     ap.add_argument("--patch-sources", default=str(Path(__file__).parent/"patch_sources"),
                     help="Folder containing cubemain.txt and UI json overrides")
     args = ap.parse_args()
@@ -2327,75 +2421,156 @@ def main():
     o_excel.mkdir(parents=True, exist_ok=True)
 
     # Copy all vanilla excel .txt into mod tree (overwrite any static versions)
+    link = args.link_vanilla_excel
     for p in v_excel.glob("*.txt"):
-        shutil.copy2(p, o_excel / p.name)
+        dst = o_excel / p.name
+        if link:
+            try:
+                if dst.exists():
+                    dst.unlink()
+                os.link(p, dst)
+                continue
+            except OSError:
+                # e.g. vanilla and output on different volumes: copy from here on
+                link = False
+        shutil.copy2(p, dst)
 
     report.append(f"[vanilla] seeded excel txt from {v_excel} into {o_excel}")
+    # Patch steps only rewrite seeded tables (never add/remove them), so one listing serves the run.
+    index_excel_dir(o_excel)
+
+    # 3) Apply locked patches to the mod root (vanilla schema already seeded).
+    # Each step is (lane, fn, args, kwargs). Steps in the "main" lane share tables and run in
+    # order in this process; every other lane owns a table no other step touches, so with
+    # --jobs > 1 those lanes run in worker processes. Report lines keep step order either way.
+    steps = [
+        ("charstats", patch_charstats_from_reference, (mod_root, patch_sources), {}),
+        ("main", patch_treasureclassex_andariel, (mod_root,), {}),
+        ("main", patch_misc_toa_version0, (mod_root,), {}),
+        ("monstats", patch_monstats_cow_xp_boost, (mod_root,), {"mult": 9999}),
+        # Classic port layer: Port ALL non-assassin/druid uniques + enable their canonical bases for Classic (forge-only).
+        ("main", apply_classic_unique_port_layer, (mod_root,), {}),
+        ("main", patch_relax_item_requirements, (mod_root,), {}),
+        # Max rolls + Classic lvlreq=0 share one uniqueitems.txt read/write.
+        ("main", patch_uniqueitems_classic_rolls, (mod_root,), {}),
+        ("main", validate_uniqueitems_invariants, (mod_root,), {}),
+        ("main", apply_tc_enrichment_highlevel_bases, (mod_root,), {"enabled": args.enable_expansion_drops_in_classic}),
+        # Cow-level base sampler (scaled / full chaos)
+        ("main", apply_cow_all_bases, (mod_root,), {"enabled": args.cow_all_bases or args.cow_all_bases_full, "full_chaos": args.cow_all_bases_full}),
+        # setitems/automagic: Classic max rolls + min->max copies share one read/write per table.
+        ("main", patch_setitems_classic_rolls, (mod_root,), {}),
+        ("magicprefix", patch_magicprefix_force_max_rolls, (mod_root,), {}),
+        ("magicsuffix", patch_magicsuffix_force_max_rolls, (mod_root,), {}),
+        ("automagic", patch_automagic_classic_rolls, (mod_root,), {}),
+        ("skills", patch_skills_holyshock_min_equals_max, (mod_root,), {}),
+        ("main", patch_misc, (mod_root,), {}),
+        ("main", patch_showlevel, (mod_root, "data/global/excel/armor.txt"), {}),
+        ("main", patch_showlevel, (mod_root, "data/global/excel/weapons.txt"), {}),
+        ("cubemain", patch_cubemain, (mod_root, patch_sources), {}),
+        ("ui", copy_ui_overrides, (mod_root, patch_sources), {"enable_ui": args.enable_ui}),
+    ]
+    run_patch_steps(steps, report, jobs=args.jobs if args.jobs != 0 else (os.cpu_count() or 1))
+
+    # 4) Write run log
+    sync_output_to_static(out, script_dir, mod_subroot, report)
+
+    (out/"log.txt").write_text("\n".join(report), encoding="utf-8")
+    print("Patched mod tree written to:", out)
+    print("Log:", out/"log.txt")
+
 
-    patch_charstats_from_reference(mod_root, patch_sources, report)
-    patch_treasureclassex_andariel(mod_root, report)
+# === Column/TSV helper utilities (explicit names; behavior-preserving) ===
 
-    # 3) Apply locked patches to the mod root (vanilla schema already seeded)
-    patch_misc_toa_version0(mod_root, report)
-    patch_monstats_cow_xp_boost(mod_root, report, mult=9999)
+_NORM_DROP = str.maketrans("", "", " \ufeff")
 
 
+@lru_cache(maxsize=4096)
+def normalize_column_key(k: str) -> str:
+    """Normalize a TSV header key for robust matching (BOM/whitespace/case); memoized per key."""
+    return (k or "").strip().lower().translate(_NORM_DROP)
 
 
+def find_column_by_name(header: list[str], desired_name: str) -> str | None:
+    """Return the actual header key matching desired_name (normalized), or None."""
+    return header_meta(header)["norm"].get(normalize_column_key(desired_name))
 
 
+_HEADER_META: dict[tuple[str, ...], dict] = {}
 
 
+def header_meta(header) -> dict:
+    """Per-header lookup maps, built once per distinct header and reused by every caller.
 
-    # Classic port layer: Port ALL non-assassin/druid uniques + enable their canonical bases for Classic (forge-only).
-    apply_classic_unique_port_layer(mod_root, report)
-    patch_relax_item_requirements(mod_root, report)
-    patch_uniqueitems_force_max_rolls(mod_root, report)
+    Keys: "lower" (lowercase name -> first header), "norm" (normalize_column_key -> first header),
+    "set" (frozenset of header names), "pos" (header name -> first index).
+    """
+    key = tuple(header)
+    m = _HEADER_META.get(key)
+    if m is None:
+        lower: dict[str, str] = {}
+        norm: dict[str, str] = {}
+        for c in key:
+            lower.setdefault(c.lower(), c)
+            norm.setdefault(normalize_column_key(c), c)
+        pos = {c: i for i, c in reversed(list(enumerate(key)))}
+        m = {"lower": lower, "norm": norm, "set": frozenset(key), "pos": pos}
+        _HEADER_META[key] = m
+    return m
 
 
-    apply_remove_unique_level_requirements(mod_root, report)
+def find_first_column(header, *names: str) -> str | None:
+    """Return the earliest header (in header order) whose normalized key is one of names."""
+    meta = header_meta(header)
+    norm = meta["norm"]
+    hits = [norm[n] for n in names if n in norm]
+    if len(hits) > 1:
+        return min(hits, key=meta["pos"].__getitem__)
+    return hits[0] if hits else None
 
 
-    validate_uniqueitems_invariants(mod_root, report)
+def find_col(fieldnames, want_lower: str) -> str | None:
+    """Return the first header whose lowercase form equals want_lower."""
+    return header_meta(fieldnames)["lower"].get(want_lower)
 
-    apply_tc_enrichment_highlevel_bases(mod_root, report, args.enable_expansion_drops_in_classic)
-    # Cow-level base sampler (scaled / full chaos)
-    apply_cow_all_bases(mod_root, report, args.cow_all_bases or args.cow_all_bases_full, args.cow_all_bases_full)
-    patch_setitems_force_max_rolls(mod_root, report)
-    patch_magicprefix_force_max_rolls(mod_root, report)
-    patch_magicsuffix_force_max_rolls(mod_root, report)
-    patch_automagic_force_max_rolls(mod_root, report)
-    patch_skills_holyshock_min_equals_max(mod_root, report)
-    patch_misc(mod_root, report)
-    patch_showlevel(mod_root, "data/global/excel/armor.txt", report)
-    patch_showlevel(mod_root, "data/global/excel/weapons.txt", report)
-    patch_automagic(mod_root, report)
-    patch_setitems(mod_root, report)
-    patch_cubemain(mod_root, patch_sources, report)
-    copy_ui_overrides(mod_root, patch_sources, report, enable_ui=args.enable_ui)
 
-    # 4) Write run log
-    sync_output_to_static(out, script_dir, mod_subroot, report)
+_EXCEL_LISTING: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
 
-    (out/"log.txt").write_text("\n".join(report), encoding="utf-8")
-    print("Patched mod tree written to:", out)
-    print("Log:", out/"log.txt")
 
+def index_excel_dir(excel_dir: Path) -> None:
+    """Snapshot the seeded excel folder with one os.scandir so table existence checks skip stat calls.
 
-# === Column/TSV helper utilities (explicit names; behavior-preserving) ===
+    Both exact and lowercased names are kept: Windows/macOS trees may differ in case from the
+    names the patchers ask for (e.g. UniqueItems.txt).
+    """
+    with os.scandir(excel_dir) as it:
+        names = frozenset(e.name for e in it if e.is_file())
+    _EXCEL_LISTING[str(excel_dir)] = (names, frozenset(n.lower() for n in names))
 
-def normalize_column_key(k: str) -> str:
-    """Normalize a TSV header key for robust matching (BOM/whitespace/case)."""
-    return (k or "").strip().lstrip("\ufeff").lower().replace(" ", "")
 
+def excel_table_exists(path: Path) -> bool:
+    """path.exists() for a table in an indexed excel folder; falls back to a stat when not indexed.
 
-def find_column_by_name(header: list[str], desired_name: str) -> str | None:
-    """Return the actual header key matching desired_name (normalized), or None."""
-    want = normalize_column_key(desired_name)
-    for k in header:
-        if normalize_column_key(k) == want:
-            return k
-    return None
+    An exact name hit or a miss in any case is answered from the snapshot; a name present only
+    in another case defers to path.exists(), which follows the filesystem's case rules.
+    """
+    listing = _EXCEL_LISTING.get(str(path.parent))
+    if listing is None:
+        return path.exists()
+    names, names_lower = listing
+    if path.name in names:
+        return True
+    if path.name.lower() not in names_lower:
+        return False
+    return path.exists()
+
+
+CLASSIC_VERSIONS = frozenset(("", "0"))
+
+
+def rows_with_version(rows: list[dict], ver_key: str, accepted) -> list[dict]:
+    """Rows whose stripped ver_key cell is in accepted; lets loops skip a per-row version gate."""
+    accepted = frozenset(accepted)
+    return [r for r in rows if (r.get(ver_key) or "").strip() in accepted]
 
 
 def build_row_index_by_column(rows: list[dict], key_column: str) -> dict[str, dict]: